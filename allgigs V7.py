@@ -1,38 +1,86 @@
 import os
 import json
-import pandas as pd
 from datetime import datetime
 import hashlib
-from supabase import create_client, Client
 from dotenv import load_dotenv
 import logging
+import logging.handlers
+import queue
+import atexit
 from pathlib import Path
 import time
-    import re
-    
-# Set up logging
+from concurrent.futures import ThreadPoolExecutor
+import csv
+import re
+from collections import Counter, defaultdict
+from functools import lru_cache
+from types import MappingProxyType
+from operator import itemgetter
+
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler with a 128 KiB write buffer; data is written when the buffer fills, a WARNING or
+    higher record is logged, flush_buffer() is called or the handler closes"""
+    buffer_size = 128 * 1024
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size, encoding=self.encoding, errors=self.errors)
+
+    def flush(self):
+        # Skip the per-record flush; flush_buffer() and close() write whatever is still buffered
+        pass
+
+    def flush_buffer(self):
+        super().flush()
+
+    def emit(self, record):
+        super().emit(record)
+        # Get warnings and errors onto disk straight away, so they survive a crash
+        if record.levelno >= logging.WARNING:
+            self.flush_buffer()
+
+class BatchFlushQueueListener(logging.handlers.QueueListener):
+    """QueueListener that flushes its handlers each time it has drained the queue, so the log
+    can be tailed during a run without flushing on every record"""
+    def handle(self, record):
+        super().handle(record)
+        if self.queue.empty():
+            for handler in self.handlers:
+                getattr(handler, 'flush_buffer', handler.flush)()
+
+# Set up logging: records are formatted by the QueueHandler and written to allgigs.log
+# by a background QueueListener, so logging calls don't block on disk writes.
+# The file is opened on the first record and then kept open for the rest of the process.
+log_queue = queue.SimpleQueue()
+log_listener = BatchFlushQueueListener(log_queue, BufferedFileHandler('allgigs.log', delay=True))
+log_listener.start()
+atexit.register(log_listener.stop)
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler('allgigs.log')
+        logging.handlers.QueueHandler(log_queue)
     ]
 )
 
+# The log format doesn't use caller file/line, thread or process info, so skip collecting it per record
+logging._srcfile = None
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
 # Suppress HTTP and verbose logs
-import logging as _logging
-_logging.getLogger("httpx").setLevel(_logging.WARNING)
-_logging.getLogger("requests").setLevel(_logging.WARNING)
-_logging.getLogger("supabase_py").setLevel(_logging.WARNING)
+for noisy_logger in ("httpx", "requests", "supabase_py"):
+    logging.getLogger(noisy_logger).setLevel(logging.WARNING)
 
 # Load environment variables
 load_dotenv('dotenv')
 
 # Load configuration from config.json
-    try:
+try:
     with open('config.json', 'r', encoding='utf-8') as f:
-            config = json.load(f)
-    except FileNotFoundError:
+        config = json.load(f)
+except FileNotFoundError:
     print("Warning: config.json not found, using default values")
     config = {}
 
@@ -42,11 +90,39 @@ SUPABASE_SERVICE_ROLE_KEY = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
 if not SUPABASE_SERVICE_ROLE_KEY:
     raise ValueError("SUPABASE_SERVICE_ROLE_KEY environment variable is not set")
 
+# Heavy imports are deferred until the required configuration is known to be present,
+# so a missing key fails fast without paying for pandas/numpy/supabase import time
+import pandas as pd
+import numpy as np
+from supabase import create_client, Client
+import httpx
+
 # Create Supabase client with service role key to bypass RLS
 supabase: Client = create_client(SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY)
 
+# Optional direct Postgres connection string; when set (and psycopg is installed),
+# table uploads use COPY instead of batched REST upserts
+SUPABASE_DB_URL = os.getenv('SUPABASE_DB_URL')
+try:
+    import psycopg
+    from psycopg import sql
+except ImportError:
+    psycopg = None
+
+# Optional xxhash; only used for grouping IDs when use_fast_hash is enabled in config
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
 # Load configuration values
 BATCH_SIZE = config.get('batch_size', 500)
+UPLOAD_WORKERS = config.get('upload_workers', 4)  # Concurrent batch requests per table upload
+COMPANY_WORKERS = config.get('company_workers', 1)  # 1 = sequential (default); concurrent source processing is opt-in
+SINGLE_INSERT_LIMIT = config.get('single_insert_limit', 500)  # Small uploads go out as one request
+USE_FAST_HASH = config.get('use_fast_hash', False)  # xxh3-128 grouping/cluster IDs instead of md5; UNIQUE_ID stays md5
+# Upsert processing results on Source instead of delete-all + insert; needs a unique constraint on "Source"
+UPSERT_PROCESSING_RESULTS = config.get('upsert_processing_results', False)
 TABLES = config.get('tables', {})
 NEW_TABLE = TABLES.get('new_table', "Allgigs_All_vacancies_NEW")
 HISTORICAL_TABLE = TABLES.get('historical_table', "Allgigs_All_vacancies")
@@ -74,13 +150,17 @@ IMPORTANT_DIR = BASE_DIR / 'Important_allGigs'
 
 # Load company mappings from JSON file
 def load_company_mappings():
-    """Load company mappings from JSON file."""
+    """
+    Load company mappings from JSON file.
+    Each mapping is stored as an ordered tuple of (standard column, source value) pairs,
+    the only shape freelance_directory consumes, instead of a per-company dict.
+    """
     json_path = Path(__file__).parent / 'company_mappings.json'
     try:
         with open(json_path, 'r', encoding='utf-8') as f:
             data = json.load(f)
             # Remove the _comment key if it exists
-            return {k: v for k, v in data.items() if k != '_comment'}
+            return {k: tuple(v.items()) for k, v in data.items() if k != '_comment'}
     except FileNotFoundError:
         logging.error(f"Company mappings file not found at {json_path}")
         return {}
@@ -88,8 +168,8 @@ def load_company_mappings():
         logging.error(f"Error parsing company mappings JSON: {e}")
         return {}
 
-# Load company mappings at module level
-COMPANY_MAPPINGS = load_company_mappings()
+# Load company mappings at module level, read-only since nothing should modify them after import
+COMPANY_MAPPINGS = MappingProxyType(load_company_mappings())
 
 # Load French patterns from JSON file
 def load_french_patterns():
@@ -162,8 +242,97 @@ LANGUAGE_PATTERNS = load_language_patterns()
 # ==================================================
 # REGIONAL CATEGORIZATION SYSTEM
 # ==================================================
+REGION_COLUMNS = ('Dutch', 'French', 'EU', 'Rest_of_World')
+
+# Shared read-only results, so categorize_location does not build a new dict per row
+DUTCH_RESULT = MappingProxyType({'Dutch': True, 'French': False, 'EU': False, 'Rest_of_World': False})
+FRENCH_RESULT = MappingProxyType({'Dutch': False, 'French': True, 'EU': False, 'Rest_of_World': False})
+EU_RESULT = MappingProxyType({'Dutch': False, 'French': False, 'EU': True, 'Rest_of_World': False})
+ROW_RESULT = MappingProxyType({'Dutch': False, 'French': False, 'EU': False, 'Rest_of_World': True})
+
+# Explicit remote region markers, checked in this order by categorize_location and categorize_locations
+REMOTE_EU_KEYWORDS = ('remote (eu)', 'eu remote')
+REMOTE_DUTCH_KEYWORDS = ('remote (netherlands)', 'remote nl')
+REMOTE_FRENCH_KEYWORDS = ('remote (france)', 'france remote')
+REMOTE_GERMANY_KEYWORDS = ('remote (germany)', 'germany remote')
+
+# Context used to place remote jobs without an explicit region
+REMOTE_CONTEXT_DUTCH_COMPANIES = ['ing', 'rabobank', 'abn amro', 'philips', 'shell', 'unilever']
+REMOTE_CONTEXT_DUTCH_SOURCES = ['freelance.nl', 'interimnetwerk']
+
+def compile_keyword_pattern(keywords):
+    """Compile substring keywords into one alternation so a single scan finds any of them."""
+    if not keywords:
+        return re.compile(r'(?!)')  # Matches nothing, like an empty keyword list
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+
+# Keyword lists used by categorize_location, built once at import instead of per call
+REMOTE_LOCATION_PATTERNS = tuple(REMOTE_PATTERNS.get('remote_patterns', []))
+HYBRID_LOCATION_PATTERNS = tuple(REMOTE_PATTERNS.get('hybrid_patterns', []))
+DUTCH_CITIES_REGIONS = tuple(GEOGRAPHIC_PATTERNS.get('dutch_cities_regions', []))
+FRENCH_CITIES_REGIONS = tuple(FRENCH_PATTERNS.get('french_cities_regions', []))
+FRENCH_SOURCES_NORMALIZED = tuple(s.lower().strip() for s in FRENCH_SOURCES)
+# '$' first: it catches nearly every USD rate, so any() usually stops after one check
+USD_INDICATORS = tuple(sorted(LANGUAGE_PATTERNS.get('currency_indicators', {}).get('usd_indicators', []), key=lambda indicator: indicator != '$'))
+DUTCH_LANGUAGE_INDICATORS = tuple(LANGUAGE_PATTERNS.get('dutch_indicators', []))
+FRENCH_LANGUAGE_INDICATORS = tuple(FRENCH_PATTERNS.get('french_language_indicators', []))
+
+# EU and rest-of-world keywords, scanned in one pass each instead of one `in` check per keyword
+EU_LOCATION_KEYWORDS = (
+    tuple(GEOGRAPHIC_PATTERNS.get('eu_countries_excluding_nl_fr', []))
+    + tuple(GEOGRAPHIC_PATTERNS.get('major_eu_cities', []))
+    + ('european union',)
+)
+ROW_LOCATION_KEYWORDS = tuple(GEOGRAPHIC_PATTERNS.get('rest_of_world_countries', []))
+
+# Single-word keywords match whole location tokens by set intersection, so "india" no longer
+# matches inside "indianapolis"; multi-word names ("united states") keep a substring scan
+LOCATION_TOKEN_PATTERN = re.compile(r'\w+')
+EU_LOCATION_TOKENS = frozenset(keyword for keyword in EU_LOCATION_KEYWORDS if ' ' not in keyword)
+ROW_LOCATION_TOKENS = frozenset(keyword for keyword in ROW_LOCATION_KEYWORDS if ' ' not in keyword)
+EU_LOCATION_PHRASES = [keyword for keyword in EU_LOCATION_KEYWORDS if ' ' in keyword]
+ROW_LOCATION_PHRASES = [keyword for keyword in ROW_LOCATION_KEYWORDS if ' ' in keyword]
+EU_PHRASE_PATTERN = compile_keyword_pattern(EU_LOCATION_PHRASES)
+ROW_PHRASE_PATTERN = compile_keyword_pattern(ROW_LOCATION_PHRASES)
+
 # Uses "Dutch by default" approach - assume Dutch unless clear evidence otherwise
 
+@lru_cache(maxsize=50000)
+def categorize_location_keywords(location_clean: str):
+    """
+    Match a cleaned location string against the city, country and region keyword lists.
+    Depends only on the location, so results are cached: scraped listings repeat the
+    same handful of locations thousands of times.
+
+    Returns:
+        The matching result mapping, or None when no keyword matches
+    """
+    if not location_clean:
+        return None
+
+    # 4.1. Check for Dutch cities and regions FIRST
+    for dutch_location in DUTCH_CITIES_REGIONS:
+        if dutch_location in location_clean:
+            return DUTCH_RESULT
+    
+    # 4.2. Check for French cities and regions
+    for french_location in FRENCH_CITIES_REGIONS:
+        if french_location in location_clean:
+            return FRENCH_RESULT
+    
+    location_tokens = frozenset(LOCATION_TOKEN_PATTERN.findall(location_clean))
+
+    # 4.3. Check for EU countries excluding Netherlands and France, major EU cities
+    # 5. and "European Union" mentions
+    if location_tokens & EU_LOCATION_TOKENS or EU_PHRASE_PATTERN.search(location_clean):
+        return EU_RESULT
+
+    # 6. Check for non-EU countries
+    if location_tokens & ROW_LOCATION_TOKENS or ROW_PHRASE_PATTERN.search(location_clean):
+        return ROW_RESULT
+
+    return None
+
 def categorize_location(location: str, rate: str = None, company: str = None, source: str = None, title: str = None, summary: str = None) -> dict:
     """
     Categorize a location into Dutch, EU, and Rest of World categories.
@@ -178,7 +347,7 @@ def categorize_location(location: str, rate: str = None, company: str = None, so
         summary (str, optional): Job description for remote/hybrid clues
 
     Returns:
-        Dict[str, bool]: Dictionary with 'Dutch', 'French', 'EU', 'Rest_of_World' as keys
+        Mapping[str, bool]: Read-only mapping with 'Dutch', 'French', 'EU', 'Rest_of_World' as keys
     """
     if pd.isna(location) or location == '':
         location_clean = ''
@@ -191,30 +360,29 @@ def categorize_location(location: str, rate: str = None, company: str = None, so
     remote_region = None
 
     # 1. DETECT REMOTE/HYBRID PATTERNS FIRST
-    remote_patterns = REMOTE_PATTERNS.get('remote_patterns', [])
-    hybrid_patterns = REMOTE_PATTERNS.get('hybrid_patterns', [])
-
-    # Check for remote patterns
-    for pattern in remote_patterns:
-        if pattern in location_clean:
-            is_remote = True
-            break
+    # An empty location can't match any location pattern, so skip straight to the rate and language checks
+    if location_clean:
+        # Check for remote patterns
+        for pattern in REMOTE_LOCATION_PATTERNS:
+            if pattern in location_clean:
+                is_remote = True
+                break
 
-    # Check for hybrid patterns
-    for pattern in hybrid_patterns:
-        if pattern in location_clean:
-            is_hybrid = True
-            break
+        # Check for hybrid patterns
+        for pattern in HYBRID_LOCATION_PATTERNS:
+            if pattern in location_clean:
+                is_hybrid = True
+                break
 
     # Extract remote region specifications
     if is_remote:
-        if 'remote (eu)' in location_clean or 'eu remote' in location_clean:
+        if any(keyword in location_clean for keyword in REMOTE_EU_KEYWORDS):
             remote_region = 'eu'
-        elif 'remote (netherlands)' in location_clean or 'remote nl' in location_clean:
+        elif any(keyword in location_clean for keyword in REMOTE_DUTCH_KEYWORDS):
             remote_region = 'dutch'
-        elif 'remote (france)' in location_clean or 'france remote' in location_clean:
+        elif any(keyword in location_clean for keyword in REMOTE_FRENCH_KEYWORDS):
             remote_region = 'french'
-        elif 'remote (germany)' in location_clean or 'germany remote' in location_clean:
+        elif any(keyword in location_clean for keyword in REMOTE_GERMANY_KEYWORDS):
             remote_region = 'eu_germany'
 
     # 2. ANALYZE CONTEXT FOR REMOTE JOBS WITHOUT REGION SPECIFICATION
@@ -222,8 +390,7 @@ def categorize_location(location: str, rate: str = None, company: str = None, so
         # Check company context for Dutch companies
         if company and not pd.isna(company):
             company_clean = str(company).lower().strip()
-            dutch_companies = ['ing', 'rabobank', 'abn amro', 'philips', 'shell', 'unilever']
-            if any(dutch_company in company_clean for dutch_company in dutch_companies):
+            if any(dutch_company in company_clean for dutch_company in REMOTE_CONTEXT_DUTCH_COMPANIES):
                 remote_region = 'dutch'
 
         # Check company context for French companies - DISABLED per user request
@@ -231,76 +398,36 @@ def categorize_location(location: str, rate: str = None, company: str = None, so
 
         # Check source context (Dutch job boards suggest Dutch remote)
         if not remote_region and source:
-            dutch_sources = ['freelance.nl', 'interimnetwerk']
-            if any(dutch_source in str(source).lower() for dutch_source in dutch_sources):
+            if any(dutch_source in str(source).lower() for dutch_source in REMOTE_CONTEXT_DUTCH_SOURCES):
                 remote_region = 'dutch'
 
         # Check source context (French job boards suggest French remote)
         if not remote_region and source:
-            # Use FRENCH_SOURCES from config (normalize to lowercase for comparison)
-            french_sources_normalized = [s.lower().strip() for s in FRENCH_SOURCES]
-            if any(french_source in str(source).lower() for french_source in french_sources_normalized):
+            # Use FRENCH_SOURCES from config (normalized to lowercase for comparison)
+            if any(french_source in str(source).lower() for french_source in FRENCH_SOURCES_NORMALIZED):
                 remote_region = 'french'
 
     # 3. APPLY REMOTE REGIONAL LOGIC
     if is_remote and remote_region:
         if remote_region == 'dutch':
-            return {'Dutch': True, 'French': False, 'EU': False, 'Rest_of_World': False}
+            return DUTCH_RESULT
         elif remote_region == 'french':
-            return {'Dutch': False, 'French': True, 'EU': False, 'Rest_of_World': False}
+            return FRENCH_RESULT
         elif remote_region.startswith('eu'):
-            return {'Dutch': False, 'French': False, 'EU': True, 'Rest_of_World': False}
+            return EU_RESULT
 
 
-    # 4. REGULAR LOCATION ANALYSIS (for non-remote or hybrid office locations)
-    
-    # 4.1. Check for Dutch cities and regions FIRST
-    dutch_cities_regions = GEOGRAPHIC_PATTERNS.get('dutch_cities_regions', [])
-    
-    # 4.2. Check for French cities and regions
-    french_cities_regions = FRENCH_PATTERNS.get('french_cities_regions', [])
-    
+    # 4-6. REGULAR LOCATION ANALYSIS (for non-remote or hybrid office locations)
     if location_clean:
-        for dutch_location in dutch_cities_regions:
-            if dutch_location in location_clean:
-                return {'Dutch': True, 'French': False, 'EU': False, 'Rest_of_World': False}
-        
-        for french_location in french_cities_regions:
-            if french_location in location_clean:
-                return {'Dutch': False, 'French': True, 'EU': False, 'Rest_of_World': False}
-    
-    # 4.3. Check for EU countries excluding Netherlands and France
-    eu_countries_excluding_nl_fr = GEOGRAPHIC_PATTERNS.get('eu_countries_excluding_nl_fr', [])
-
-    major_eu_cities = GEOGRAPHIC_PATTERNS.get('major_eu_cities', [])
-
-    if location_clean:
-        for country in eu_countries_excluding_nl_fr:
-            if country in location_clean:
-                return {'Dutch': False, 'French': False, 'EU': True, 'Rest_of_World': False}
-
-        for city in major_eu_cities:
-            if city in location_clean:
-                return {'Dutch': False, 'French': False, 'EU': True, 'Rest_of_World': False}
-
-    # 5. Check for "European Union" mentions
-    if location_clean and 'european union' in location_clean:
-        return {'Dutch': False, 'French': False, 'EU': True, 'Rest_of_World': False}
-
-    # 6. Check for non-EU countries
-    rest_of_world_countries = GEOGRAPHIC_PATTERNS.get('rest_of_world_countries', [])
-
-    if location_clean:
-        for country in rest_of_world_countries:
-            if country in location_clean:
-                return {'Dutch': False, 'French': False, 'EU': False, 'Rest_of_World': True}
+        location_result = categorize_location_keywords(location_clean)
+        if location_result is not None:
+            return location_result
 
     # 7. Check for USD currency
     if rate and not pd.isna(rate):
         rate_str = str(rate).lower().strip()
-        usd_indicators = LANGUAGE_PATTERNS.get('currency_indicators', {}).get('usd_indicators', [])
-        if any(indicator in rate_str for indicator in usd_indicators):
-            return {'Dutch': False, 'French': False, 'EU': False, 'Rest_of_World': True}
+        if any(indicator in rate_str for indicator in USD_INDICATORS):
+            return ROW_RESULT
 
     # 7.5. LANGUAGE DETECTION - Check for Dutch and French language indicators
     def detect_dutch_language(text_fields):
@@ -308,14 +435,11 @@ def categorize_location(location: str, rate: str = None, company: str = None, so
         if not text_fields:
             return False
         
-        # Dutch language indicators
-        dutch_indicators = LANGUAGE_PATTERNS.get('dutch_indicators', [])
-        
         # Combine all text fields
         combined_text = ' '.join([str(field).lower() for field in text_fields if field and not pd.isna(field)])
         
         # Count Dutch indicators
-        dutch_count = sum(1 for indicator in dutch_indicators if indicator in combined_text)
+        dutch_count = sum(1 for indicator in DUTCH_LANGUAGE_INDICATORS if indicator in combined_text)
         
         # If we find 3 or more Dutch indicators, consider it Dutch
         return dutch_count >= 3
@@ -325,14 +449,11 @@ def categorize_location(location: str, rate: str = None, company: str = None, so
         if not text_fields:
             return False
         
-        # French language indicators
-        french_indicators = FRENCH_PATTERNS.get('french_language_indicators', [])
-        
         # Combine all text fields
         combined_text = ' '.join([str(field).lower() for field in text_fields if field and not pd.isna(field)])
         
         # Count French indicators
-        french_count = sum(1 for indicator in french_indicators if indicator in combined_text)
+        french_count = sum(1 for indicator in FRENCH_LANGUAGE_INDICATORS if indicator in combined_text)
         
         # If we find 3 or more French indicators, consider it French
         return french_count >= 3
@@ -342,59 +463,129 @@ def categorize_location(location: str, rate: str = None, company: str = None, so
     
     # Check French language first (more specific)
     if detect_french_language(text_fields):
-        return {'Dutch': False, 'French': True, 'EU': False, 'Rest_of_World': False}
+        return FRENCH_RESULT
     
     # Check Dutch language
     if detect_dutch_language(text_fields):
-        return {'Dutch': True, 'French': False, 'EU': False, 'Rest_of_World': False}
+        return DUTCH_RESULT
 
     # 8. Default to Dutch
-    return {'Dutch': True, 'French': False, 'EU': False, 'Rest_of_World': False}
+    return DUTCH_RESULT
+
+def series_contains_any(series: pd.Series, patterns) -> pd.Series:
+    """Vectorized `any(pattern in value for pattern in patterns)` over a Series of strings."""
+    if not patterns:
+        return pd.Series(False, index=series.index)
+    return series.str.contains('|'.join(re.escape(pattern) for pattern in patterns), regex=True)
+
+def series_contains_word(series: pd.Series, words) -> pd.Series:
+    """Vectorized check for any of `words` occurring as a whole word in a Series of strings."""
+    if not words:
+        return pd.Series(False, index=series.index)
+    return series.str.contains(r'\b(?:' + '|'.join(re.escape(word) for word in words) + r')\b', regex=True)
+
+def series_count_contained(series: pd.Series, patterns) -> pd.Series:
+    """Vectorized `sum(1 for pattern in patterns if pattern in value)` over a Series of strings."""
+    counts = pd.Series(0, index=series.index)
+    for pattern in patterns:
+        counts += series.str.contains(pattern, regex=False)
+    return counts
+
+def categorize_locations(df: pd.DataFrame, location_column: str = 'Location') -> pd.DataFrame:
+    """
+    Vectorized categorize_location over a whole DataFrame.
+    Applies the same rules in the same order, as boolean masks over each column
+    instead of one Python call per row.
 
-def classify_job_industry(title, summary=''):
-    """Classify job into industry category"""
-    if pd.isna(title):
-        return 'Other/General'
-    
-    text = str(title).lower()
-    if summary and not pd.isna(summary):
-        text += ' ' + str(summary).lower()
-    
-    # Preprocessing: Remove seniority prefixes to focus on core role
-    import re
-    text = re.sub(r'\b(senior|junior|medior|lead)\s+', '', text)
-    
-    # Handle work arrangement tags - Enhanced filtering
-    skip_patterns = LANGUAGE_PATTERNS.get('work_arrangement_patterns', {}).get('skip_patterns', [])
-    
-    # Enhanced work arrangement tag detection
-    words = text.split()
-    if len(words) <= 8:  # Increased from 3 to catch more complex work arrangement combinations
-        if any(pattern in text for pattern in skip_patterns):
-            # Additional check for hour specifications
-            hour_patterns = LANGUAGE_PATTERNS.get('work_arrangement_patterns', {}).get('hour_patterns', [])
-            if any(hour_pattern in text for hour_pattern in hour_patterns):
-                return 'No title information'  # Mark as insufficient data for industry classification
-            # Check for basic work arrangement patterns
-            if any(basic_pattern in text for basic_pattern in skip_patterns):
-                return 'No title information'  # Mark as insufficient data for industry classification
-    
-    # Special title-based rules
-    title_lower = str(title).lower()
-    if 'front-end' in title_lower or 'frontend' in title_lower:
-        return 'IT & Software Development'
-    if 'developer' in title_lower:
-        return 'IT & Software Development'
-    
-    # Check for "IT" with strict word boundaries in title
-    import re
-    if re.search(r'\bit\b', title_lower):
-        return 'IT & Software Development'
-    
-    # Check for "security" anywhere in title
-    if 'security' in title_lower:
-        return 'Security & Safety'
-    
+    Args:
+        df (pd.DataFrame): DataFrame with the location column and optional
+            'rate', 'Company', 'Source', 'Title' and 'Summary' columns
+        location_column (str): The name of the location column to analyze
+
+    Returns:
+        pd.DataFrame: Boolean 'Dutch', 'French', 'EU', 'Rest_of_World' columns aligned to df.index
+    """
+    def raw_column(column):
+        return df[column] if column in df.columns else pd.Series(None, index=df.index, dtype=object)
+
+    def lower_text(values, present):
+        return values.where(present, '').astype(str).str.lower()
+
+    def is_present(values):
+        # Mirrors the scalar `value and not pd.isna(value)` checks
+        return values.notna() & values.astype(bool)
+
+    location = raw_column(location_column)
+    title = raw_column('Title')
+    summary = raw_column('Summary')
+    company = raw_column('Company')
+    source = raw_column('Source')
+    rate = raw_column('rate')
+
+    # Lowercase each column once; the stripped and language-detection variants reuse it
+    location_lower = lower_text(location, location.notna())
+    company_lower = lower_text(company, is_present(company))
+    location_clean = location_lower.str.strip()
+    company_clean = company_lower.str.strip()
+    source_lower = lower_text(source, is_present(source))
+    rate_clean = lower_text(rate, is_present(rate)).str.strip()
+
+    # 1-3. Remote jobs with an explicit or contextual region
+    is_remote = series_contains_any(location_clean, REMOTE_LOCATION_PATTERNS)
+    explicit_eu = series_contains_any(location_clean, REMOTE_EU_KEYWORDS)
+    explicit_dutch = ~explicit_eu & series_contains_any(location_clean, REMOTE_DUTCH_KEYWORDS)
+    explicit_french = ~explicit_eu & ~explicit_dutch & series_contains_any(location_clean, REMOTE_FRENCH_KEYWORDS)
+    explicit_germany = ~explicit_eu & ~explicit_dutch & ~explicit_french & series_contains_any(location_clean, REMOTE_GERMANY_KEYWORDS)
+    no_explicit_region = ~(explicit_eu | explicit_dutch | explicit_french | explicit_germany)
+
+    context_dutch = no_explicit_region & (
+        series_contains_any(company_clean, REMOTE_CONTEXT_DUTCH_COMPANIES)
+        | series_contains_any(source_lower, REMOTE_CONTEXT_DUTCH_SOURCES)
+    )
+    context_french = no_explicit_region & ~context_dutch & series_contains_any(source_lower, FRENCH_SOURCES_NORMALIZED)
+
+    # 4-7. Location keywords and currency, in the same precedence as categorize_location
+    conditions = [
+        is_remote & (explicit_dutch | context_dutch),
+        is_remote & (explicit_french | context_french),
+        is_remote & (explicit_eu | explicit_germany),
+        series_contains_any(location_clean, DUTCH_CITIES_REGIONS),
+        series_contains_any(location_clean, FRENCH_CITIES_REGIONS),
+        series_contains_word(location_clean, EU_LOCATION_TOKENS) | series_contains_any(location_clean, EU_LOCATION_PHRASES),
+        series_contains_word(location_clean, ROW_LOCATION_TOKENS) | series_contains_any(location_clean, ROW_LOCATION_PHRASES) | series_contains_any(rate_clean, USD_INDICATORS),
+    ]
+    choices = ['Dutch', 'French', 'EU', 'Dutch', 'French', 'EU', 'Rest_of_World']
+
+    # 7.5. Language detection, only for rows no earlier rule decided
+    undecided = pd.Series(~np.logical_or.reduce(conditions), index=df.index)
+    french_language = pd.Series(False, index=df.index)
+    if undecided.any():
+        field_texts = [
+            location_lower[undecided].where(is_present(location[undecided]), ''),
+            lower_text(title[undecided], is_present(title[undecided])),
+            lower_text(summary[undecided], is_present(summary[undecided])),
+            company_lower[undecided],
+        ]
+        combined_text = pd.Series(
+            [' '.join(part for part in parts if part) for parts in zip(*field_texts)],
+            index=df.index[undecided]
+        )
+        french_language[undecided] = series_count_contained(combined_text, FRENCH_LANGUAGE_INDICATORS) >= 3
+    conditions.append(french_language)
+    choices.append('French')
+    # Dutch language and the final fallback both resolve to Dutch
+
+    region = np.select(conditions, choices, default='Dutch')
+    # One numpy.bool_ block, so the columns never fall back to object dtype
+    region_flags = np.asarray(region[:, np.newaxis] == np.array(REGION_COLUMNS), dtype=np.bool_)
+    return pd.DataFrame(region_flags, index=df.index, columns=list(REGION_COLUMNS))
+
+# Precompiled patterns for industry classification
+SENIORITY_PREFIX_PATTERN = re.compile(r'\b(senior|junior|medior|lead)\s+')
+IT_WORD_PATTERN = re.compile(r'\bit\b')
+
+def load_industry_keyword_patterns():
+    """Load industry keywords from JSON and compile one word-boundary pattern per industry, in matching order."""
     # Load industry keywords from JSON file
     try:
         with open('industry_keywords.json', 'r', encoding='utf-8') as f:
@@ -476,15 +667,63 @@ def classify_job_industry(title, summary=''):
     for category in standard_categories:
         if category not in keywords:
             keywords[category] = []
+
+    patterns = []
+    for industry, words in keywords.items():
+        if words:
+            # One alternation per industry matches if any of its keywords matches as a whole word
+            pattern = r'\b(?:' + '|'.join(re.escape(word) for word in words) + r')\b'
+            patterns.append((industry, re.compile(pattern, re.IGNORECASE)))
+    return patterns
+
+# Load and compile industry keyword patterns at module level
+INDUSTRY_KEYWORD_PATTERNS = load_industry_keyword_patterns()
+
+def classify_job_industry(title, summary=''):
+    """Classify job into industry category"""
+    if pd.isna(title):
+        return 'Other/General'
     
-    import re
+    text = str(title).lower()
+    if summary and not pd.isna(summary):
+        text += ' ' + str(summary).lower()
     
-    for industry, words in keywords.items():
-        for word in words:
-            # Create word boundary pattern
-            pattern = r'\b' + re.escape(word) + r'\b'
-            if re.search(pattern, text, re.IGNORECASE):
-                return industry
+    # Preprocessing: Remove seniority prefixes to focus on core role
+    text = SENIORITY_PREFIX_PATTERN.sub('', text)
+    
+    # Handle work arrangement tags - Enhanced filtering
+    skip_patterns = LANGUAGE_PATTERNS.get('work_arrangement_patterns', {}).get('skip_patterns', [])
+    
+    # Enhanced work arrangement tag detection
+    words = text.split()
+    if len(words) <= 8:  # Increased from 3 to catch more complex work arrangement combinations
+        if any(pattern in text for pattern in skip_patterns):
+            # Additional check for hour specifications
+            hour_patterns = LANGUAGE_PATTERNS.get('work_arrangement_patterns', {}).get('hour_patterns', [])
+            if any(hour_pattern in text for hour_pattern in hour_patterns):
+                return 'No title information'  # Mark as insufficient data for industry classification
+            # Check for basic work arrangement patterns
+            if any(basic_pattern in text for basic_pattern in skip_patterns):
+                return 'No title information'  # Mark as insufficient data for industry classification
+    
+    # Special title-based rules
+    title_lower = str(title).lower()
+    if 'front-end' in title_lower or 'frontend' in title_lower:
+        return 'IT & Software Development'
+    if 'developer' in title_lower:
+        return 'IT & Software Development'
+    
+    # Check for "IT" with strict word boundaries in title
+    if IT_WORD_PATTERN.search(title_lower):
+        return 'IT & Software Development'
+    
+    # Check for "security" anywhere in title
+    if 'security' in title_lower:
+        return 'Security & Safety'
+    
+    for industry, pattern in INDUSTRY_KEYWORD_PATTERNS:
+        if pattern.search(text):
+            return industry
     
     return 'Other/General'
 
@@ -522,7 +761,7 @@ def detect_work_arrangement(location: str = None, title: str = None, summary: st
             except Exception:
                 region_classification = None
 
-            if isinstance(region_classification, dict):
+            if region_classification is not None:
                 if region_classification.get('Dutch'):
                     return 'Remote (Netherlands)'
                 if region_classification.get('EU'):
@@ -561,38 +800,22 @@ def add_regional_columns(df: pd.DataFrame, location_column: str = 'Location') ->
         logging.warning(f"Column '{location_column}' not found in DataFrame")
         return df
 
-    df_copy = df.copy()
+    # Only new columns are added, so a shallow copy keeps the caller's frame untouched without duplicating its data
+    df_copy = df.copy(deep=False)
 
     # Add WORK ARRANGEMENT column first
-    work_arrangements = []
-    for idx, row in df_copy.iterrows():
-        arrangement = detect_work_arrangement(
-            location=row.get(location_column),
-            title=row.get('Title'),
-            summary=row.get('Summary'),
-            company=row.get('Company'),
-            source=row.get('Source')
-        )
-        work_arrangements.append(arrangement)
-    df_copy['Work_Arrangement'] = work_arrangements
-
-    # Apply regional categorization with enhanced remote/hybrid logic
-    def categorize_row(row):
-        return categorize_location(
-            location=row.get(location_column),
-            rate=row.get('rate'),
-            company=row.get('Company'),
-            source=row.get('Source'),
-            title=row.get('Title'),
-            summary=row.get('Summary')
-        )
-
-    categorizations = df_copy.apply(categorize_row, axis=1)
+    # Select only the needed columns (missing ones become None) and iterate plain tuples
+    arrangement_inputs = df_copy.reindex(columns=[location_column, 'Title', 'Summary', 'Company', 'Source'])
+    df_copy['Work_Arrangement'] = [
+        detect_work_arrangement(*row)
+        for row in arrangement_inputs.itertuples(index=False, name=None)
+    ]
 
-    # Extract regional boolean values with safety checks
-    df_copy['Dutch'] = categorizations.apply(lambda x: x.get('Dutch', True) if x is not None else True)
-    df_copy['EU'] = categorizations.apply(lambda x: x.get('EU', False) if x is not None else False)
-    df_copy['Rest_of_World'] = categorizations.apply(lambda x: x.get('Rest_of_World', False) if x is not None else False)
+    # Apply regional categorization with enhanced remote/hybrid logic, vectorized over all rows
+    categorizations = categorize_locations(df_copy, location_column)
+    df_copy['Dutch'] = categorizations['Dutch']
+    df_copy['EU'] = categorizations['EU']
+    df_copy['Rest_of_World'] = categorizations['Rest_of_World']
 
     return df_copy
 
@@ -610,12 +833,9 @@ def analyze_regional_distribution(df: pd.DataFrame) -> dict:
         logging.warning("Regional columns not found. Run add_regional_columns first.")
         return {}
     
-    distribution = {
-        'Dutch': df['Dutch'].sum(),
-        'EU': df['EU'].sum(),
-        'Rest_of_World': df['Rest_of_World'].sum(),
-        'Total': len(df)
-    }
+    # One reduction over the bool block instead of a separate sum per column
+    distribution = df[['Dutch', 'EU', 'Rest_of_World']].sum().to_dict()
+    distribution['Total'] = len(df)
     
     return distribution
 
@@ -644,10 +864,56 @@ def timestamp():
     """Get current timestamp in YYYY-MM-DD format."""
     return datetime.now().strftime("%Y-%m-%d")
 
+# Normalization patterns shared by the ID generators
+PUNCTUATION_PATTERN = re.compile(r'[^\w\s]+')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+LOCATION_PREFIX_PATTERN = re.compile(r'\b(remote|hybrid|on-site|onsite|work from home|wfh|locatie:|location:)\b')
+DIGITS_PATTERN = re.compile(r'\d+')
+DATE_RANGE_PATTERN = re.compile(r'(\d{4}-\d{2}-\d{2})\s*(?:to|until|-)\s*(\d{4}-\d{2}-\d{2})')
+NON_ALNUM_PATTERN = re.compile(r'[^a-z0-9]')
+MULTI_UNDERSCORE_PATTERN = re.compile(r'_+')
+
+if USE_FAST_HASH and xxhash is None:
+    logging.warning("use_fast_hash is enabled but xxhash is not installed, falling back to md5 IDs")
+
+def md5_hexdigest(text):
+    """MD5 hex digest of a string. IDs are not a security boundary, so skip the FIPS-guarded path."""
+    return hashlib.md5(text.encode('utf-8'), usedforsecurity=False).hexdigest()
+
+# UNIQUE_ID is the table key and always md5; grouping and cluster IDs may use the faster hash
+if USE_FAST_HASH and xxhash is not None:
+    def id_hexdigest(text):
+        """128-bit xxh3 hex digest of a string, a faster non-cryptographic fingerprint for grouping IDs."""
+        return xxhash.xxh3_128_hexdigest(text.encode('utf-8'))
+else:
+    id_hexdigest = md5_hexdigest
+
+# Mapping defaults that the ID generators treat as empty
+DEFAULT_LOCATION_VALUES = frozenset({'not mentioned', 'see vacancy', 'asap', 'remote', 'hybrid', 'on-site', 'onsite'})
+DEFAULT_FIELD_VALUES = frozenset({'not mentioned', 'see vacancy', 'asap'})
+# Known default values that should be treated as "not from input"
+DEFAULT_INPUT_VALUES = frozenset({
+    'not mentioned', 'see vacancy', 'asap', 'remote', 'hybrid', 'on-site', 'onsite',
+    'amsterdam', 'hilversum', 'gelderland', '36', 'price'
+})
+
+# ID returned for empty and default values, hashed once instead of in every early exit
+EMPTY_ID = md5_hexdigest('')
+
 def generate_unique_id(title, url, company):
     """Generate a unique ID based on the combination of title, URL, and company."""
-    combined = f"{title}|{url}|{company}".encode('utf-8')
-    return hashlib.md5(combined).hexdigest()
+    return md5_hexdigest(f"{title}|{url}|{company}")
+
+def hash_joined_columns(df, columns, separator, hexdigest=id_hexdigest):
+    """Join the string form of columns row-wise with vectorized concatenation, then hash each key."""
+    combined = df[columns[0]].map(str)
+    for column in columns[1:]:
+        combined = combined + separator + df[column].map(str)
+    return [hexdigest(text) for text in combined]
+
+def generate_unique_ids(df):
+    """Bulk generate_unique_id: build the combined keys column-wise, then hash each one."""
+    return hash_joined_columns(df, ['Title', 'URL', 'Company'], '|', md5_hexdigest)
 
 def generate_group_id(title):
     """Generate a group ID based on a cleaned-up title for grouping similar jobs."""
@@ -657,99 +923,94 @@ def generate_group_id(title):
     # 3. Standardize whitespace
     try:
         cleaned_title = title.lower()
-        cleaned_title = re.sub(r'[^\w\s]', '', cleaned_title) # Remove punctuation
-        cleaned_title = re.sub(r'\s+', ' ', cleaned_title).strip() # Standardize whitespace
+        cleaned_title = PUNCTUATION_PATTERN.sub('', cleaned_title) # Remove punctuation
+        cleaned_title = WHITESPACE_PATTERN.sub(' ', cleaned_title).strip() # Standardize whitespace
 
         # Log the transformation for debugging purposes (commented out for cleaner logs)
         # if title != cleaned_title:
         #     logging.info(f"group_id generation: Converted '{title}' to '{cleaned_title}'")
 
-        combined = cleaned_title.encode('utf-8')
-        return hashlib.md5(combined).hexdigest()
+        return id_hexdigest(cleaned_title)
     except Exception as e:
         logging.error(f"Could not generate group_id for title: {title}. Error: {e}")
         # Fallback to using the raw title if cleaning fails
-        return hashlib.md5(title.encode('utf-8')).hexdigest()
+        return id_hexdigest(title)
 
 def generate_location_id(location, is_from_input=True):
     """Generate a location ID based on normalized location terms."""
     try:
         # If this is a default value from mapping, return empty ID
         if not is_from_input or pd.isna(location) or location == '':
-            return hashlib.md5(''.encode('utf-8')).hexdigest()
+            return EMPTY_ID
         
-        # List of common default values that should be treated as empty
-        default_values = {'not mentioned', 'see vacancy', 'asap', 'remote', 'hybrid', 'on-site', 'onsite'}
-        if str(location).lower().strip() in default_values:
-            return hashlib.md5(''.encode('utf-8')).hexdigest()
+        # Common default values should be treated as empty
+        if str(location).lower().strip() in DEFAULT_LOCATION_VALUES:
+            return EMPTY_ID
         
         # Normalize location for ID generation
         cleaned_location = str(location).lower()
         # Remove common location prefixes/suffixes
-        cleaned_location = re.sub(r'\b(remote|hybrid|on-site|onsite|work from home|wfh|locatie:|location:)\b', '', cleaned_location)
+        cleaned_location = LOCATION_PREFIX_PATTERN.sub('', cleaned_location)
         # Remove punctuation and special characters
-        cleaned_location = re.sub(r'[^\w\s]', '', cleaned_location)
+        cleaned_location = PUNCTUATION_PATTERN.sub('', cleaned_location)
         # Standardize whitespace
-        cleaned_location = re.sub(r'\s+', ' ', cleaned_location).strip()
+        cleaned_location = WHITESPACE_PATTERN.sub(' ', cleaned_location).strip()
         
         if not cleaned_location:
-            return hashlib.md5(''.encode('utf-8')).hexdigest()
+            return EMPTY_ID
         
-        return hashlib.md5(cleaned_location.encode('utf-8')).hexdigest()
+        return id_hexdigest(cleaned_location)
     except Exception as e:
         logging.error(f"Could not generate location_id for location: {location}. Error: {e}")
-        return hashlib.md5(''.encode('utf-8')).hexdigest()
+        return EMPTY_ID
 
 def generate_hours_id(hours, is_from_input=True):
     """Generate an hours ID based on the last number in ranges."""
     try:
         # If this is a default value from mapping, return empty ID
         if not is_from_input or pd.isna(hours) or hours == '':
-            return hashlib.md5(''.encode('utf-8')).hexdigest()
+            return EMPTY_ID
         
-        # List of common default values that should be treated as empty
-        default_values = {'not mentioned', 'see vacancy', 'asap'}
-        if str(hours).lower().strip() in default_values:
-            return hashlib.md5(''.encode('utf-8')).hexdigest()
+        # Common default values should be treated as empty
+        if str(hours).lower().strip() in DEFAULT_FIELD_VALUES:
+            return EMPTY_ID
         
         hours_str = str(hours).strip()
         
         # Extract all numbers from the string
-        numbers = re.findall(r'\d+', hours_str)
+        numbers = DIGITS_PATTERN.findall(hours_str)
         if not numbers:
-            return hashlib.md5(''.encode('utf-8')).hexdigest()
+            return EMPTY_ID
         
         # For ranges like "3-6", use the last number (6)
         last_number = numbers[-1]
         
-        return hashlib.md5(last_number.encode('utf-8')).hexdigest()
+        return id_hexdigest(last_number)
     except Exception as e:
         logging.error(f"Could not generate hours_id for hours: {hours}. Error: {e}")
-        return hashlib.md5(''.encode('utf-8')).hexdigest()
+        return EMPTY_ID
 
 def generate_duration_id(duration, is_from_input=True):
     """Generate a duration ID based on numbers or calculated months from date ranges."""
     try:
         # If this is a default value from mapping, return empty ID
         if not is_from_input or pd.isna(duration) or duration == '':
-            return hashlib.md5(''.encode('utf-8')).hexdigest()
+            return EMPTY_ID
         
-        # List of common default values that should be treated as empty
-        default_values = {'not mentioned', 'see vacancy', 'asap'}
-        if str(duration).lower().strip() in default_values:
-            return hashlib.md5(''.encode('utf-8')).hexdigest()
+        # Common default values should be treated as empty
+        if str(duration).lower().strip() in DEFAULT_FIELD_VALUES:
+            return EMPTY_ID
         
         duration_str = str(duration).strip()
         
         # Check for date ranges like "2024-01-01 to 2024-06-30"
-        date_pattern = r'(\d{4}-\d{2}-\d{2})\s*(?:to|until|-)\s*(\d{4}-\d{2}-\d{2})'
-        date_match = re.search(date_pattern, duration_str)
+        date_match = DATE_RANGE_PATTERN.search(duration_str)
         
         if date_match:
             try:
-                from datetime import datetime
-                start_date = datetime.strptime(date_match.group(1), '%Y-%m-%d')
-                end_date = datetime.strptime(date_match.group(2), '%Y-%m-%d')
+                # Both groups are plain YYYY-MM-DD, which fromisoformat parses on a C fast path
+                start_date = datetime.fromisoformat(date_match.group(1))
+                end_date = datetime.fromisoformat(date_match.group(2))
                 
                 # Calculate months between dates
                 months_diff = (end_date.year - start_date.year) * 12 + (end_date.month - start_date.month)
@@ -758,23 +1019,23 @@ def generate_duration_id(duration, is_from_input=True):
                 if end_date.day >= start_date.day:
                     months_diff += 1
                 
-                return hashlib.md5(str(months_diff).encode('utf-8')).hexdigest()
+                return id_hexdigest(str(months_diff))
             except ValueError:
                 # If date parsing fails, fall back to number extraction
                 pass
         
         # Extract all numbers from the string
-        numbers = re.findall(r'\d+', duration_str)
+        numbers = DIGITS_PATTERN.findall(duration_str)
         if not numbers:
-            return hashlib.md5(''.encode('utf-8')).hexdigest()
+            return EMPTY_ID
         
         # For ranges like "3-6", use the last number (6)
         last_number = numbers[-1]
         
-        return hashlib.md5(last_number.encode('utf-8')).hexdigest()
+        return id_hexdigest(last_number)
     except Exception as e:
         logging.error(f"Could not generate duration_id for duration: {duration}. Error: {e}")
-        return hashlib.md5(''.encode('utf-8')).hexdigest()
+        return EMPTY_ID
 
 def get_generic_job_terms():
     """Return generic job terms covering ALL industries, excluding seniority levels."""
@@ -822,108 +1083,126 @@ def get_generic_job_terms():
         'assist', 'serve', 'deliver', 'provide', 'ensure', 'improve'
     ]
 
+GENERIC_JOB_TERMS = get_generic_job_terms()
+# Single-word terms are matched against the summary's word set in one scan; the few
+# multi-word terms keep a precompiled whole-phrase search. Together this matches the
+# per-term \b...\b search, including overlapping terms like 'tech lead' and 'lead'.
+WORD_PATTERN = re.compile(r'\w+')
+JOB_TERM_PHRASE_PATTERNS = {
+    term: re.compile(r'\b' + re.escape(term) + r'\b')
+    for term in GENERIC_JOB_TERMS if ' ' in term
+}
+
 def generate_summary_id(summary, is_from_input=True):
     """Generate a summary ID based on generic job terms."""
     try:
         # If this is a default value from mapping, return empty ID
         if not is_from_input or pd.isna(summary) or summary == '':
-            return hashlib.md5(''.encode('utf-8')).hexdigest()
+            return EMPTY_ID
         
-        # List of common default values that should be treated as empty
-        default_values = {'not mentioned', 'see vacancy', 'asap'}
-        if str(summary).lower().strip() in default_values:
-            return hashlib.md5(''.encode('utf-8')).hexdigest()
+        # Common default values should be treated as empty
+        if str(summary).lower().strip() in DEFAULT_FIELD_VALUES:
+            return EMPTY_ID
         
-        # Get generic job terms
-        job_terms = get_generic_job_terms()
-        
-        # Extract matching terms from summary
+        # Extract matching terms from summary (exact word matches, not partial)
         summary_lower = str(summary).lower()
-        found_terms = []
-        
-        for term in job_terms:
-            # Check for exact word matches (not partial)
-            if re.search(r'\b' + re.escape(term) + r'\b', summary_lower):
-                found_terms.append(term)
+        summary_words = set(WORD_PATTERN.findall(summary_lower))
+        found_terms = [
+            term for term in GENERIC_JOB_TERMS
+            if (JOB_TERM_PHRASE_PATTERNS[term].search(summary_lower) if ' ' in term else term in summary_words)
+        ]
         
         # If no terms found, return empty ID
         if not found_terms:
-            return hashlib.md5(''.encode('utf-8')).hexdigest()
+            return EMPTY_ID
         
         # Sort terms for consistent ID generation
         found_terms.sort()
         
         # Create ID from found terms
         terms_string = '|'.join(found_terms)
-        return hashlib.md5(terms_string.encode('utf-8')).hexdigest()
+        return id_hexdigest(terms_string)
         
     except Exception as e:
         logging.error(f"Could not generate summary_id for summary: {summary}. Error: {e}")
-        return hashlib.md5(''.encode('utf-8')).hexdigest()
+        return EMPTY_ID
+
+# Source name normalization tables for generate_source_id
+SOURCE_SUFFIXES = ('.com', '.nl', '.org', '.eu', ' b.v.', ' bv', ' b.v', ' ltd', ' inc', ' corp', ' gmbh')
+SOURCE_PREFIXES = ('www.', 'http://', 'https://')
+SOURCE_MAPPING_ITEMS = tuple(SOURCE_MAPPINGS.items()) if isinstance(SOURCE_MAPPINGS, dict) else ()
+# Zero-width lookahead reports a key at every position, even where keys overlap. The first
+# mapping in config order is then the lowest index found, as with the original linear scan.
+SOURCE_MAPPING_PATTERN = re.compile(
+    '(?=(' + '|'.join(re.escape(key) for key, _ in SOURCE_MAPPING_ITEMS) + '))'
+) if SOURCE_MAPPING_ITEMS else None
+SOURCE_MAPPING_INDEX = {key: index for index, (key, _) in enumerate(SOURCE_MAPPING_ITEMS)}
 
 def generate_source_id(source, is_from_input=True):
     """Generate a source ID for grouping jobs by their source/platform."""
     try:
         # If this is a default value from mapping, return empty ID
         if not is_from_input or pd.isna(source) or source == '':
-            return hashlib.md5(''.encode('utf-8')).hexdigest()
+            return EMPTY_ID
         
-        # Normalize the source name
-        source_lower = str(source).lower().strip()
+        # Normalize the source name (sources are almost always strings already)
+        source_lower = (source if isinstance(source, str) else str(source)).lower().strip()
+        if not source_lower:
+            return EMPTY_ID
         
         # Remove common suffixes and prefixes
         source_normalized = source_lower
         
-        # Remove common company suffixes
-        suffixes_to_remove = ['.com', '.nl', '.org', '.eu', ' b.v.', ' bv', ' b.v', ' ltd', ' inc', ' corp', ' gmbh']
-        for suffix in suffixes_to_remove:
-            if source_normalized.endswith(suffix):
-                source_normalized = source_normalized[:-len(suffix)].strip()
+        # Remove common company suffixes; one endswith() over the whole tuple skips the
+        # ordered loop for the usual name without any suffix
+        if source_normalized.endswith(SOURCE_SUFFIXES):
+            for suffix in SOURCE_SUFFIXES:
+                if source_normalized.endswith(suffix):
+                    source_normalized = source_normalized.removesuffix(suffix).strip()
         
         # Remove common prefixes
-        prefixes_to_remove = ['www.', 'http://', 'https://']
-        for prefix in prefixes_to_remove:
-            if source_normalized.startswith(prefix):
-                source_normalized = source_normalized[len(prefix):].strip()
-        
-        # Handle special cases for known sources using config file mappings
-        # Use the global SOURCE_MAPPINGS from config, but ensure it's a dictionary
-        source_mappings = SOURCE_MAPPINGS if isinstance(SOURCE_MAPPINGS, dict) else {}
-        
-        # Check if normalized source matches any known mapping
-        for key, mapped_value in source_mappings.items():
-            if key in source_normalized:
-                source_normalized = mapped_value
-                break
+        if source_normalized.startswith(SOURCE_PREFIXES):
+            for prefix in SOURCE_PREFIXES:
+                if source_normalized.startswith(prefix):
+                    source_normalized = source_normalized.removeprefix(prefix).strip()
+        
+        # Handle special cases for known sources using config file mappings:
+        # one scan finds every mapping key in the name, the earliest configured one wins
+        if SOURCE_MAPPING_PATTERN is not None:
+            matched_indexes = [SOURCE_MAPPING_INDEX[key] for key in SOURCE_MAPPING_PATTERN.findall(source_normalized)]
+            if matched_indexes:
+                source_normalized = SOURCE_MAPPING_ITEMS[min(matched_indexes)][1]
         
         # Replace spaces and special characters with underscores
-        source_normalized = re.sub(r'[^a-z0-9]', '_', source_normalized)
+        source_normalized = NON_ALNUM_PATTERN.sub('_', source_normalized)
         
         # Remove multiple underscores
-        source_normalized = re.sub(r'_+', '_', source_normalized).strip('_')
+        source_normalized = MULTI_UNDERSCORE_PATTERN.sub('_', source_normalized).strip('_')
         
         # If empty after normalization, use original
         if not source_normalized:
-            source_normalized = str(source).lower().strip()
+            source_normalized = source_lower
         
-        return hashlib.md5(source_normalized.encode('utf-8')).hexdigest()
+        return id_hexdigest(source_normalized)
         
     except Exception as e:
         logging.error(f"Could not generate source_id for source: {source}. Error: {e}")
-        return hashlib.md5(''.encode('utf-8')).hexdigest()
+        return EMPTY_ID
+
+def apply_per_unique(series, func):
+    """Apply func once per distinct value of a Series and map the results back onto every row."""
+    # Categorical-style encoding: integer codes into the distinct values, so the results are
+    # spread back with one array take instead of a hash lookup per row
+    codes, unique_values = pd.factorize(series, use_na_sentinel=False)
+    results = np.array([func(value) for value in unique_values], dtype=object)
+    return pd.Series(results[codes], index=series.index)
 
 def is_from_input_value(value):
     """Check if a value is from actual input or a default mapping."""
     if pd.isna(value) or value == '':
         return False
     
-    # Known default values that should be treated as "not from input"
-    default_values = {
-        'not mentioned', 'see vacancy', 'asap', 'remote', 'hybrid', 'on-site', 'onsite',
-        'amsterdam', 'hilversum', 'gelderland', '36', 'price'
-    }
-    
-    return str(value).lower().strip() not in default_values
+    return str(value).lower().strip() not in DEFAULT_INPUT_VALUES
 
 def validate_dataframe(df, required_columns):
     """Validate that DataFrame has required columns and data."""
@@ -1056,131 +1335,132 @@ def special_umc_processing(df, company_name):
         logging.info(f"🔧 {company_name}: Processed Hours to remove 'p.w.'")
     return df
 
+# InterimNetwerk job block patterns, compiled once instead of per job block
+INTERIMNETWERK_BLOCK_START_PATTERN = re.compile(r'\d{5}[A-Za-z]')
+INTERIMNETWERK_NUMBER_PATTERN = re.compile(r'(\d{5})')
+INTERIMNETWERK_DURATION_PATTERN = re.compile(r'Verwachte opdrachtduur:\s*([^\n\r]*?)(?=\n|\r|Plaats/regio|$)', re.DOTALL)
+INTERIMNETWERK_LOCATION_PATTERN = re.compile(r'Plaats/regio:\s*([^\n\r]*?)(?=\n|\r|Profiel|$)', re.DOTALL)
+INTERIMNETWERK_BEDRIJF_PATTERN = re.compile(r'Profiel van het bedrijf:\s*(.*?)(?=Profiel van de opdracht|Profiel van de manager|Opmerkingen|Nu reageren|$)', re.DOTALL)
+INTERIMNETWERK_OPDRACHT_PATTERN = re.compile(r'Profiel van de opdracht:\s*(.*?)(?=Profiel van de manager|Opmerkingen|Nu reageren|$)', re.DOTALL)
+INTERIMNETWERK_EDGE_PUNCTUATION_PATTERN = re.compile(r'^[,\-\s]+|[,\-\s]+$')
+# Duration phrases stripped from titles; applied in order, as each removal can expose the next
+INTERIMNETWERK_TITLE_DURATION_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\d+\s*maanden?',
+    r'\d+\s*jaar',
+    r'Half\s*jaar',
+    r'\d+\s*-\s*\d+\s*maanden?',
+    r'\d+\s*uur\s*per\s*week',
+    r'\d+\s*dagen\s*per\s*week',
+    r'gemiddeld\s*\d+\s*uur',
+    r'fulltime',
+    r'start\s*asap',
+    r'start:\s*\d+',
+    r'optie\s*tot\s*verlenging'
+))
+
 def special_interimnetwerk_processing(df, company_name):
     """Special processing for InterimNetwerk - extract data from Text column"""
     if 'Text' in df.columns and 'Field1_links' in df.columns:
-                # Take only the first row of Text column but keep all Field1_links
+        # Take only the first row of Text column but keep all Field1_links
         if len(df) > 0:
             text_content = df['Text'].iloc[0]
-                    # Combine all Field1_links from all rows to get complete URL list
-                    all_field1_links = []
+            # Combine all Field1_links from all rows to get complete URL list
+            all_field1_links = []
             for idx, row in df.iterrows():
-                        if pd.notna(row['Field1_links']) and row['Field1_links']:
-                            all_field1_links.append(str(row['Field1_links']))
-                    field1_links = " ".join(all_field1_links)
+                if pd.notna(row['Field1_links']) and row['Field1_links']:
+                    all_field1_links.append(str(row['Field1_links']))
+            field1_links = " ".join(all_field1_links)
                     
-                    # Split text into individual job blocks using the 5-digit number pattern
-                    job_blocks = re.split(r'(\d{5}[A-Za-z])', str(text_content))
+            # Split text into individual job blocks using the 5-digit number pattern:
+            # each block runs from one job header (e.g. "88959Interim") to the next
+            text_content = str(text_content)
+            block_starts = [match.start() for match in INTERIMNETWERK_BLOCK_START_PATTERN.finditer(text_content)]
+            block_ends = block_starts[1:] + [len(text_content)]
+            jobs = [text_content[start:end] for start, end in zip(block_starts, block_ends)]
                     
-                    # Filter out empty blocks and reconstruct job blocks
-                    jobs = []
-                    for i in range(1, len(job_blocks), 2):
-                        if i + 1 < len(job_blocks):
-                            job_header = job_blocks[i]  # e.g., "88959Interim"
-                            job_content = job_blocks[i + 1]  # rest of the job content
-                            full_job = job_header + job_content
-                            jobs.append(full_job)
-                    
-                    processed_data = []
-                    for job_block in jobs:
-                        # Extract 5-digit number from start of block
-                        number_match = re.match(r'(\d{5})', job_block)
-                        if not number_match:
-                            continue
+            processed_data = []
+            for job_block in jobs:
+                # Extract 5-digit number from start of block
+                number_match = INTERIMNETWERK_NUMBER_PATTERN.match(job_block)
+                if not number_match:
+                    continue
                             
-                        number = number_match.group(1)
+                number = number_match.group(1)
                         
-                        # Extract title: text after number until we hit duration info or location
-                        title_pattern = rf'{number}([^|]*?)(?=\d+ maanden|\d+ jaar|Half jaar|Verwachte opdrachtduur|Plaats/regio|\|)'
-                        title_match = re.search(title_pattern, job_block)
-                        title = title_match.group(1).strip() if title_match else "Not found"
-                        title = re.sub(r'\s+', ' ', title).strip()  # Clean up whitespace
+                # Extract title: text after number until we hit duration info or location
+                title_pattern = rf'{number}([^|]*?)(?=\d+ maanden|\d+ jaar|Half jaar|Verwachte opdrachtduur|Plaats/regio|\|)'
+                title_match = re.search(title_pattern, job_block)
+                title = title_match.group(1).strip() if title_match else "Not found"
+                title = WHITESPACE_PATTERN.sub(' ', title).strip()  # Clean up whitespace
                         
-                        # Extract duration first to remove it from title later
-                        duration_pattern = r'Verwachte opdrachtduur:\s*([^\n\r]*?)(?=\n|\r|Plaats/regio|$)'
-                        duration_match = re.search(duration_pattern, job_block, re.DOTALL)
-                        duration = duration_match.group(1).strip() if duration_match else "Not mentioned"
+                # Extract duration first to remove it from title later
+                duration_match = INTERIMNETWERK_DURATION_PATTERN.search(job_block)
+                duration = duration_match.group(1).strip() if duration_match else "Not mentioned"
                         
-                        # Clean title by removing duration text that appears in it
-                        if duration != "Not mentioned" and duration:
-                            # Remove the exact duration text from title
-                            title = title.replace(duration, "").strip()
-                            # Remove common duration patterns that might appear in title
-                            duration_patterns_to_remove = [
-                                r'\d+\s*maanden?',
-                                r'\d+\s*jaar',
-                                r'Half\s*jaar',
-                                r'\d+\s*-\s*\d+\s*maanden?',
-                                r'\d+\s*uur\s*per\s*week',
-                                r'\d+\s*dagen\s*per\s*week',
-                                r'gemiddeld\s*\d+\s*uur',
-                                r'fulltime',
-                                r'start\s*asap',
-                                r'start:\s*\d+',
-                                r'optie\s*tot\s*verlenging'
-                            ]
-                            for pattern in duration_patterns_to_remove:
-                                title = re.sub(pattern, '', title, flags=re.IGNORECASE).strip()
+                # Clean title by removing duration text that appears in it
+                if duration != "Not mentioned" and duration:
+                    # Remove the exact duration text from title
+                    title = title.replace(duration, "").strip()
+                    # Remove common duration patterns that might appear in title
+                    for pattern in INTERIMNETWERK_TITLE_DURATION_PATTERNS:
+                        title = pattern.sub('', title).strip()
                         
-                        # Final cleanup of title
-                        title = re.sub(r'\s+', ' ', title).strip()
-                        title = re.sub(r'^[,\-\s]+|[,\-\s]+$', '', title).strip()  # Remove leading/trailing punctuation
+                # Final cleanup of title
+                title = WHITESPACE_PATTERN.sub(' ', title).strip()
+                title = INTERIMNETWERK_EDGE_PUNCTUATION_PATTERN.sub('', title).strip()  # Remove leading/trailing punctuation
                         
-                        # Extract location: text after "Plaats/regio:"
-                        location_pattern = r'Plaats/regio:\s*([^\n\r]*?)(?=\n|\r|Profiel|$)'
-                        location_match = re.search(location_pattern, job_block, re.DOTALL)
-                        location = location_match.group(1).strip() if location_match else "Not mentioned"
+                # Extract location: text after "Plaats/regio:"
+                location_match = INTERIMNETWERK_LOCATION_PATTERN.search(job_block)
+                location = location_match.group(1).strip() if location_match else "Not mentioned"
                         
-                        # Extract summary: combine "Profiel van het bedrijf:" and "Profiel van de opdracht:"
-                        summary_parts = []
+                # Extract summary: combine "Profiel van het bedrijf:" and "Profiel van de opdracht:"
+                summary_parts = []
                         
-                        # Find "Profiel van het bedrijf:"
-                        bedrijf_pattern = r'Profiel van het bedrijf:\s*(.*?)(?=Profiel van de opdracht|Profiel van de manager|Opmerkingen|Nu reageren|$)'
-                        bedrijf_match = re.search(bedrijf_pattern, job_block, re.DOTALL)
-                        if bedrijf_match:
-                            bedrijf_text = re.sub(r'\s+', ' ', bedrijf_match.group(1).strip())
-                            summary_parts.append(f"Bedrijf: {bedrijf_text}")
+                # Find "Profiel van het bedrijf:"
+                bedrijf_match = INTERIMNETWERK_BEDRIJF_PATTERN.search(job_block)
+                if bedrijf_match:
+                    bedrijf_text = WHITESPACE_PATTERN.sub(' ', bedrijf_match.group(1).strip())
+                    summary_parts.append(f"Bedrijf: {bedrijf_text}")
                         
-                        # Find "Profiel van de opdracht:"
-                        opdracht_pattern = r'Profiel van de opdracht:\s*(.*?)(?=Profiel van de manager|Opmerkingen|Nu reageren|$)'
-                        opdracht_match = re.search(opdracht_pattern, job_block, re.DOTALL)
-                        if opdracht_match:
-                            opdracht_text = re.sub(r'\s+', ' ', opdracht_match.group(1).strip())
-                            summary_parts.append(f"Opdracht: {opdracht_text}")
+                # Find "Profiel van de opdracht:"
+                opdracht_match = INTERIMNETWERK_OPDRACHT_PATTERN.search(job_block)
+                if opdracht_match:
+                    opdracht_text = WHITESPACE_PATTERN.sub(' ', opdracht_match.group(1).strip())
+                    summary_parts.append(f"Opdracht: {opdracht_text}")
                         
-                        summary = " | ".join(summary_parts) if summary_parts else "Not mentioned"
+                summary = " | ".join(summary_parts) if summary_parts else "Not mentioned"
                         
-                        # Find matching URL for this number in Field1_links
-                        url = "Not found"
-                        if field1_links and number in str(field1_links):
-                            url_pattern = rf'(https?://[^\s,]*{number}[^\s,]*)'
-                            url_match = re.search(url_pattern, str(field1_links))
-                            if url_match:
-                                url = url_match.group(1)
+                # Find matching URL for this number in Field1_links
+                url = "Not found"
+                if field1_links and number in str(field1_links):
+                    url_pattern = rf'(https?://[^\s,]*{number}[^\s,]*)'
+                    url_match = re.search(url_pattern, str(field1_links))
+                    if url_match:
+                        url = url_match.group(1)
                         
-                        processed_data.append({
-                            'Title': title,
-                            'Location': location,
-                            'Summary': summary,
-                            'URL': url,
-                            'Duration': duration,
-                            'start': 'ASAP',
-                            'rate': 'Not mentioned',
+                processed_data.append({
+                    'Title': title,
+                    'Location': location,
+                    'Summary': summary,
+                    'URL': url,
+                    'Duration': duration,
+                    'start': 'ASAP',
+                    'rate': 'Not mentioned',
                     'Hours': 'Not mentioned',
-                                                    'Company': 'InterimNetwerk',
-                        'Source': 'InterimNetwerk',
-        'Type source': 'Job board',
+                    'Company': 'InterimNetwerk',
+                    'Source': 'InterimNetwerk',
+                    'Type source': 'Job board',
                     'date': timestamp(),
                     'UNIQUE_ID': generate_unique_id(title, url, 'InterimNetwerk')
-                        })
+                })
                     
-                    # Convert to DataFrame
+            # Convert to DataFrame
             df = pd.DataFrame(processed_data)
             logging.info(f"InterimNetwerk special processing: Created {len(df)} rows from {len(jobs)} job blocks")
-                else:
+        else:
             logging.warning(f"🔧 {company_name}: No data found in CSV file")
             df = pd.DataFrame()
-            else:
+    else:
         logging.warning(f"🔧 {company_name}: Required columns 'Text' and 'Field1_links' not found")
         df = pd.DataFrame()
     return df
@@ -1279,7 +1559,7 @@ def process_hours_flexvalue(hours_str):
         number = match.group(1)
         return number
     
-                        return 'Not mentioned'
+    return 'Not mentioned'
                     
 def process_title_amstelveenhuurtin(title_str):
     """Process title for Amstelveenhuurtin - remove words in brackets and words starting with 'SO' followed by a number"""
@@ -1306,10 +1586,10 @@ def process_title_amstelveenhuurtin(title_str):
 
 def process_location_amstelveenhuurtin(location_str):
     """Process location for Amstelveenhuurtin - extract text between 'standplaats:' and '|'"""
-                    if pd.isna(location_str) or location_str == '':
-                        return 'Not mentioned'
+    if pd.isna(location_str) or location_str == '':
+        return 'Not mentioned'
                     
-                    location_clean = str(location_str).strip()
+    location_clean = str(location_str).strip()
                     
     # Find text between "standplaats:" and "|"
     import re
@@ -1367,136 +1647,136 @@ def process_hours_hinttech(hours_str):
 
 def process_duration_hinttech(duration_str):
     """Process duration for HintTech - calculate difference between start and end dates"""
-                    if pd.isna(duration_str) or duration_str == '':
-                        return 'Not mentioned'
+    if pd.isna(duration_str) or duration_str == '':
+        return 'Not mentioned'
                     
-                    try:
+    try:
         # Parse date range (assuming format like "2024-01-01 to 2024-06-30" or similar)
-                        duration_clean = str(duration_str).strip()
+        duration_clean = str(duration_str).strip()
                         
         # Common separators for date ranges
         separators = [' to ', ' - ', ' tot ', ' t/m ', ' until ', ' through ']
                         
-                        for sep in separators:
-                            if sep in duration_clean.lower():
-                                parts = duration_clean.lower().split(sep)
-                                if len(parts) == 2:
-                                    start_date_str = parts[0].strip()
-                                    end_date_str = parts[1].strip()
+        for sep in separators:
+            if sep in duration_clean.lower():
+                parts = duration_clean.lower().split(sep)
+                if len(parts) == 2:
+                    start_date_str = parts[0].strip()
+                    end_date_str = parts[1].strip()
                                     
-                                    # Try to parse dates with common formats
-                                    from datetime import datetime
+                    # Try to parse dates with common formats
+                    from datetime import datetime
                     date_formats = ['%Y-%m-%d', '%d-%m-%Y', '%m/%d/%Y', '%d/%m/%Y', '%Y/%m/%d']
                                     
-                                    start_date = None
-                                    end_date = None
+                    start_date = None
+                    end_date = None
                                     
-                                    for fmt in date_formats:
-                                        try:
-                                            start_date = datetime.strptime(start_date_str, fmt)
-                                            end_date = datetime.strptime(end_date_str, fmt)
-                                            break
-                                        except ValueError:
-                                            continue
+                    for fmt in date_formats:
+                        try:
+                            start_date = datetime.strptime(start_date_str, fmt)
+                            end_date = datetime.strptime(end_date_str, fmt)
+                            break
+                        except ValueError:
+                            continue
                                     
-                                    if start_date and end_date:
-                                        # Calculate difference in days
-                                        diff_days = (end_date - start_date).days
-                                        if diff_days > 0:
-                                            # Convert to months/weeks if appropriate
+                    if start_date and end_date:
+                        # Calculate difference in days
+                        diff_days = (end_date - start_date).days
+                        if diff_days > 0:
+                            # Convert to months/weeks if appropriate
                             if diff_days >= 30:
-                                                months = diff_days // 30
-                                                return f"{months} months"
-                                            elif diff_days >= 7:
-                                                weeks = diff_days // 7
-                                                return f"{weeks} weeks"
-                                            else:
-                                                return f"{diff_days} days"
-                                    break
+                                months = diff_days // 30
+                                return f"{months} months"
+                            elif diff_days >= 7:
+                                weeks = diff_days // 7
+                                return f"{weeks} weeks"
+                            else:
+                                return f"{diff_days} days"
+                    break
                         
-                        return duration_clean  # Return original if can't parse
-                    except Exception:
-                        return 'Not mentioned'
+        return duration_clean  # Return original if can't parse
+    except Exception:
+        return 'Not mentioned'
                 
 def process_location_indeed(index, files_read):
     """Process location for indeed - extract location from Field2 column"""
-                    import re
+    import re
                     
-                    # Get the Field2 value from the original input DataFrame
-                    field2_val = files_read.iloc[index]['Field2'] if 'Field2' in files_read.columns else None
+    # Get the Field2 value from the original input DataFrame
+    field2_val = files_read.iloc[index]['Field2'] if 'Field2' in files_read.columns else None
                     
-                    if pd.isna(field2_val) or field2_val == '':
-                        return 'Not mentioned'
+    if pd.isna(field2_val) or field2_val == '':
+        return 'Not mentioned'
                     
-                    field2_str = str(field2_val)
+    field2_str = str(field2_val)
                     
-                    # Search for the exact word "Locatie" and extract everything after it until "&" marker
-                    locatie_pattern = r'Locatie([^&]*)'
-                    locatie_match = re.search(locatie_pattern, field2_str)
+    # Search for the exact word "Locatie" and extract everything after it until "&" marker
+    locatie_pattern = r'Locatie([^&]*)'
+    locatie_match = re.search(locatie_pattern, field2_str)
                     
-                    if locatie_match:
-                        location = locatie_match.group(1).strip()
-                        return location if location else 'Not mentioned'
+    if locatie_match:
+        location = locatie_match.group(1).strip()
+        return location if location else 'Not mentioned'
                     
-                    return 'Not mentioned'
+    return 'Not mentioned'
                 
 def process_rate_indeed(index, files_read):
     """Process rate for indeed - extract rate from Field2 column"""
-                    import re
-                    # Get the Field2 value from the original input DataFrame
-                    field2_val = files_read.iloc[index]['Field2'] if 'Field2' in files_read.columns else None
-                    if pd.isna(field2_val) or field2_val == '':
-                        return None
-                    field2_str = str(field2_val)
-                    # Search for rate information in Field2 (look for patterns like "€", "EUR", "euro", etc.)
-                    rate_patterns = [
-                        r'€\s*(\d+(?:[.,]\d+)?)',        # € 50 or € 50,00
-                        r'(\d+(?:[.,]\d+)?)\s*€',        # 50 € or 50,00 €
-                        r'EUR\s*(\d+(?:[.,]\d+)?)',      # EUR 50
-                        r'(\d+(?:[.,]\d+)?)\s*EUR',      # 50 EUR
-                        r'euro\s*(\d+(?:[.,]\d+)?)',     # euro 50
-                        r'(\d+(?:[.,]\d+)?)\s*euro',     # 50 euro
-                        r'(\d+(?:[.,]\d+)?)\s*per\s*uur',   # 50 per uur
-                        r'(\d+(?:[.,]\d+)?)\s*per\s*day',   # 50 per day
-                        r'(\d+(?:[.,]\d+)?)\s*per\s*week',  # 50 per week
-                        r'(\d+(?:[.,]\d+)?)\s*per\s*month'  # 50 per month
-                    ]
-                    for pattern in rate_patterns:
-                        rate_match = re.search(pattern, field2_str, re.IGNORECASE)
-                        if rate_match:
-                            rate = rate_match.group(1).replace(',', '.')
-                            return rate
-                    return None
+    import re
+    # Get the Field2 value from the original input DataFrame
+    field2_val = files_read.iloc[index]['Field2'] if 'Field2' in files_read.columns else None
+    if pd.isna(field2_val) or field2_val == '':
+        return None
+    field2_str = str(field2_val)
+    # Search for rate information in Field2 (look for patterns like "€", "EUR", "euro", etc.)
+    rate_patterns = [
+        r'€\s*(\d+(?:[.,]\d+)?)',        # € 50 or € 50,00
+        r'(\d+(?:[.,]\d+)?)\s*€',        # 50 € or 50,00 €
+        r'EUR\s*(\d+(?:[.,]\d+)?)',      # EUR 50
+        r'(\d+(?:[.,]\d+)?)\s*EUR',      # 50 EUR
+        r'euro\s*(\d+(?:[.,]\d+)?)',     # euro 50
+        r'(\d+(?:[.,]\d+)?)\s*euro',     # 50 euro
+        r'(\d+(?:[.,]\d+)?)\s*per\s*uur',   # 50 per uur
+        r'(\d+(?:[.,]\d+)?)\s*per\s*day',   # 50 per day
+        r'(\d+(?:[.,]\d+)?)\s*per\s*week',  # 50 per week
+        r'(\d+(?:[.,]\d+)?)\s*per\s*month'  # 50 per month
+    ]
+    for pattern in rate_patterns:
+        rate_match = re.search(pattern, field2_str, re.IGNORECASE)
+        if rate_match:
+            rate = rate_match.group(1).replace(',', '.')
+            return rate
+    return None
 
 def process_summary_indeed(index, files_read, result):
     """Process summary for indeed - use Field2 but remove the first line"""
-                    try:
-                        source_val = None
-                        if 'Field2' in files_read.columns:
-                            source_val = files_read.iloc[index]['Field2']
-                        if pd.isna(source_val) or source_val == '':
-                            source_val = result.iloc[index]['Summary'] if index < len(result) else ''
-                        summary_str = str(source_val)
-                        # Normalize line breaks and split
-                        summary_str = summary_str.replace('\r\n', '\n').replace('\r', '\n')
-                        lines = summary_str.split('\n')
-                        if len(lines) <= 1:
-                            cleaned = summary_str.strip()
-                        else:
-                            cleaned = ' '.join([ln.strip() for ln in lines[1:] if ln.strip()])
-                        return cleaned if cleaned else 'See Vacancy'
-                    except Exception:
-                        return 'See Vacancy'
+    try:
+        source_val = None
+        if 'Field2' in files_read.columns:
+            source_val = files_read.iloc[index]['Field2']
+        if pd.isna(source_val) or source_val == '':
+            source_val = result.iloc[index]['Summary'] if index < len(result) else ''
+        summary_str = str(source_val)
+        # Normalize line breaks and split
+        summary_str = summary_str.replace('\r\n', '\n').replace('\r', '\n')
+        lines = summary_str.split('\n')
+        if len(lines) <= 1:
+            cleaned = summary_str.strip()
+        else:
+            cleaned = ' '.join([ln.strip() for ln in lines[1:] if ln.strip()])
+        return cleaned if cleaned else 'See Vacancy'
+    except Exception:
+        return 'See Vacancy'
 
 def extract_strict_rate(text_str):
     """Extract strict rate for werk.nl - extract only relevant numbers (rates/salaries) from Text column"""
     if pd.isna(text_str) or text_str == '':
-                    return 'Not mentioned'
+        return 'Not mentioned'
                 
     text_clean = str(text_str).strip()
     
     # Look for specific rate/salary patterns only
-                    import re
+    import re
     
     # Pattern for "€X/hour" or "€X per hour" or "€X/uur"
     euro_per_hour = re.search(r'€\s*(\d+(?:\.\d+)?)\s*(?:per\s+hour|/hour|/uur)', text_clean, re.IGNORECASE)
@@ -1546,27 +1826,27 @@ def extract_strict_rate(text_str):
         if 20 <= amount <= 1000:
             return f'€{amount:.0f}'
     
-                        return 'Not mentioned'
+    return 'Not mentioned'
 
 def process_title_twine(title_str):
     """Process title for twine - remove 'Easy Apply ' text"""
-                    if pd.isna(title_str) or title_str == '':
-                        return 'Not mentioned'
+    if pd.isna(title_str) or title_str == '':
+        return 'Not mentioned'
                     
     title_clean = str(title_str).strip()
                     
     # Remove "Easy Apply " (case insensitive)
     title_clean = title_clean.replace('Easy Apply ', '').replace('easy apply ', '')
                     
-                    # Clean up extra spaces
-                    title_clean = ' '.join(title_clean.split()).strip()
+    # Clean up extra spaces
+    title_clean = ' '.join(title_clean.split()).strip()
                     
-                    return title_clean if title_clean else 'Not mentioned'
+    return title_clean if title_clean else 'Not mentioned'
                 
 def process_rate_haarlemmermeer(rate_str):
     """Process rate for haarlemmermeerhuurtin - remove 'per uur' and keep only the amount"""
-                    if pd.isna(rate_str) or rate_str == '':
-                        return 'Not mentioned'
+    if pd.isna(rate_str) or rate_str == '':
+        return 'Not mentioned'
     # Remove "per uur" (case insensitive) and clean up
     rate_clean = str(rate_str).lower().replace('per uur', '').replace('peruur', '').strip()
     # Remove extra spaces and return
@@ -1575,12 +1855,12 @@ def process_rate_haarlemmermeer(rate_str):
 
 def process_duration_haarlemmermeer(duration_str):
     """Process duration for haarlemmermeerhuurtin - calculate difference between start and end dates"""
-                    if pd.isna(duration_str) or duration_str == '':
-                        return 'Not mentioned'
+    if pd.isna(duration_str) or duration_str == '':
+        return 'Not mentioned'
                     
-                    try:
+    try:
         # Parse date range (assuming format like "01-07-2025 t/m 01-01-2026" or similar)
-                        duration_clean = str(duration_str).strip()
+        duration_clean = str(duration_str).strip()
                         
         # Common separators for date ranges (including Dutch separators)
         separators = [' t/m ', ' to ', ' - ', ' tot ', ' until ', ' through ', ' tm ']
@@ -1593,7 +1873,7 @@ def process_duration_haarlemmermeer(duration_str):
                     end_date_str = parts[1].strip()
 
                     # Try to parse dates with common formats
-                        from datetime import datetime
+                    from datetime import datetime
                     date_formats = ['%d-%m-%Y', '%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%Y/%m/%d']
 
                     start_date = None
@@ -1604,7 +1884,7 @@ def process_duration_haarlemmermeer(duration_str):
                             start_date = datetime.strptime(start_date_str, fmt)
                             end_date = datetime.strptime(end_date_str, fmt)
                             break
-                            except ValueError:
+                        except ValueError:
                             continue
                     
                     if start_date and end_date:
@@ -1618,20 +1898,20 @@ def process_duration_haarlemmermeer(duration_str):
                             elif diff_days >= 7:
                                 weeks = diff_days // 7
                                 return f"{weeks} weeks"
-                        else:
+                            else:
                                 return f"{diff_days} days"
-                break
+                    break
                             
         return duration_clean  # Return original if can't parse
-                    except Exception:
+    except Exception:
         return 'Not mentioned'
 
 def process_rate_werk(rate_str):
     """Process rate for werk.nl - extract rate information"""
-                    if pd.isna(rate_str) or rate_str == '':
-                        return 'Not mentioned'
+    if pd.isna(rate_str) or rate_str == '':
+        return 'Not mentioned'
                     
-                        rate_clean = str(rate_str).strip()
+    rate_clean = str(rate_str).strip()
     # Extract rate information - this is a placeholder function
     # You may need to implement specific logic based on werk.nl's rate format
     return rate_clean if rate_clean else 'Not mentioned'
@@ -1648,13 +1928,13 @@ def process_location_tennet(location_str):
 
 def process_hours_freelance_nl(hours_str):
     """Process hours for freelance.nl - extract hours information"""
-                    if pd.isna(hours_str) or hours_str == '':
-                        return 'Not mentioned'
+    if pd.isna(hours_str) or hours_str == '':
+        return 'Not mentioned'
                     
-                    hours_clean = str(hours_str).strip()
+    hours_clean = str(hours_str).strip()
     # Extract hours information - this is a placeholder function
     # You may need to implement specific logic based on freelance.nl's hours format
-                    return hours_clean if hours_clean else 'Not mentioned'
+    return hours_clean if hours_clean else 'Not mentioned'
                 
 def apply_special_processing(df, company_name):
     """Apply special processing based on company name"""
@@ -1679,7 +1959,7 @@ def apply_special_processing(df, company_name):
             if processing_type in processing_functions:
                 df = processing_functions[processing_type](df, company_name)
                 logging.info(f"🔧 {company_name}: Applied {processing_type}")
-                            else:
+            else:
                 logging.warning(f"🔧 {company_name}: Processing type {processing_type} not implemented")
         
         return df
@@ -1687,7 +1967,7 @@ def apply_special_processing(df, company_name):
     except FileNotFoundError:
         logging.warning(f"🔧 {company_name}: special_processing.json not found, skipping special processing")
         return df
-                    except Exception as e:
+    except Exception as e:
         logging.error(f"🔧 {company_name}: Error in special processing: {e}")
         return df
 
@@ -1700,6 +1980,11 @@ def freelance_directory(files_read, company_name):
             logging.warning(f"No mapping found for company {company_name}")
             return pd.DataFrame()
         
+        # Nothing to map, clean or categorize for an empty input (e.g. a scraper that returned no rows)
+        if files_read.empty:
+            logging.info(f"{company_name}: empty input, skipping")
+            return pd.DataFrame()
+        
         # First replace all NaN/None values with empty strings in the input DataFrame
         files_read = files_read.fillna('')
         
@@ -1709,12 +1994,12 @@ def freelance_directory(files_read, company_name):
         result = pd.DataFrame()
         
         # Map the columns according to the mapping
-        for std_col, src_col_mapping_value in mapping.items():
+        for std_col, src_col_mapping_value in mapping:
             if src_col_mapping_value in files_read.columns:
                 if company_name == 'werk.nl' and std_col == 'Company' and src_col_mapping_value == 'Description':
                     # Special handling for werk.nl: split Description on "-" and use first part as Company
                     result[std_col] = files_read['Description'].str.split('-').str[0].str.strip()
-                            else:
+                else:
                     result[std_col] = files_read[src_col_mapping_value]
             elif '+' in src_col_mapping_value or ',' in src_col_mapping_value:
                 # Handle column merging (e.g., 'col1+col2+col3' or 'col1, col2, col3')
@@ -1731,17 +2016,17 @@ def freelance_directory(files_read, company_name):
                     for col in existing_columns[1:]:
                         merged_data = merged_data + ' ' + files_read[col].astype(str)
                     result[std_col] = merged_data
-                        else:
+                else:
                     # No columns found, assign empty string
                     result[std_col] = pd.Series([''] * len(files_read), index=files_read.index)
-                    else:
+            else:
                 # If the mapping value is not a column name, assign the mapping value itself.
                 # This handles literal defaults like 'Company': 'LinkIT' or 'start': 'ASAP'.
                 # If files_read is empty (e.g. due to pre-mapping filter), ensure Series is not created with wrong length.
                 if files_read.empty:
                     # Create an empty series of appropriate type if result is also going to be empty for this column
                     result[std_col] = pd.Series(dtype='object') 
-                    else:
+                else:
                     result[std_col] = src_col_mapping_value
 
         # PLACEHOLDER DETECTION DISABLED per user request
@@ -1869,23 +2154,10 @@ def freelance_directory(files_read, company_name):
         # REGIONAL CATEGORIZATION - Apply to all jobs
         # Create Dutch, French, EU, Rest_of_World boolean columns
         logging.info("Applying regional categorization...")
-        regional_categories = result.apply(
-            lambda row: categorize_location(
-                location=row.get('Location', ''),
-                rate=row.get('rate', ''),
-                company=row.get('Company', ''),
-                source=row.get('Source', ''),
-                title=row.get('Title', ''),
-                summary=row.get('Summary', '')
-            ), 
-            axis=1
-        )
+        regional_categories = categorize_locations(result)
         
-        # Extract the boolean values into separate columns
-        result['Dutch'] = regional_categories.apply(lambda x: x.get('Dutch', False))
-        result['French'] = regional_categories.apply(lambda x: x.get('French', False))
-        result['EU'] = regional_categories.apply(lambda x: x.get('EU', False))
-        result['Rest_of_World'] = regional_categories.apply(lambda x: x.get('Rest_of_World', False))
+        # Write the boolean columns directly, no per-row unpacking
+        result[['Dutch', 'French', 'EU', 'Rest_of_World']] = regional_categories
         
         # Log regional distribution
         dutch_count = result['Dutch'].sum()
@@ -1949,183 +2221,154 @@ def get_existing_records(table_name):
         
     return pd.DataFrame(all_records)
 
+# Error codes worth retrying: HTTP 429/5xx, plus Postgres serialization failure, deadlock,
+# statement timeout and PostgREST's connection-pool timeout
+TRANSIENT_ERROR_CODES = frozenset({'429', '500', '502', '503', '504', '40001', '40P01', '57014', 'PGRST003'})
+
+def is_transient_error(error):
+    """True for failures that may succeed on retry: timeouts, connection errors and the codes above"""
+    if isinstance(error, (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)):
+        return True
+    code = str(getattr(error, 'code', None) or '')
+    return code in TRANSIENT_ERROR_CODES or code.startswith('08')  # 08xxx: connection exceptions
+
+def execute_with_backoff(query, max_attempts=3):
+    """
+    Execute a Supabase query, retrying with exponential backoff when the request fails
+    transiently (e.g. when the server responds with HTTP 429). Permanent errors such as
+    constraint violations, bad payloads or auth failures are re-raised immediately.
+    """
+    for attempt in range(max_attempts):
+        try:
+            return query.execute()
+        except Exception as e:
+            if attempt == max_attempts - 1 or not is_transient_error(e):
+                raise
+            wait_seconds = 2 ** attempt
+            logging.warning(f"Supabase request failed ({e}), retrying in {wait_seconds}s (attempt {attempt + 1}/{max_attempts})")
+            time.sleep(wait_seconds)
+
 def prepare_data_for_upload(df, historical_data=None):
     """
     Prepare DataFrame for upload by adding date, unique ID, and group ID.
     If historical_data is provided, preserves dates for existing records.
     """
     # Add UNIQUE_ID, group_id and date columns
-    df['UNIQUE_ID'] = df.apply(
-        lambda row: generate_unique_id(row['Title'], row['URL'], row['Company']),
-        axis=1
-    )
-    df['group_id'] = df.apply(
-        lambda row: generate_group_id(row['Title']),
-        axis=1
-    )
+    df['UNIQUE_ID'] = generate_unique_ids(df)
+    # group_id, location_id and source_id only depend on a single column, so hash each distinct value once
+    df['group_id'] = apply_per_unique(df['Title'], generate_group_id)
     
     # Add new ID columns for Location, Hours, and Duration
     logging.info("Generating additional ID columns...")
-    df['location_id'] = df.apply(
-        lambda row: generate_location_id(row['Location'], is_from_input_value(row['Location'])),
-        axis=1
-    )
-    df['hours_id'] = df.apply(
-        lambda row: generate_hours_id(row['Hours'], is_from_input_value(row['Hours'])),
-        axis=1
-    )
-    df['duration_id'] = df.apply(
-        lambda row: generate_duration_id(row['Duration'], is_from_input_value(row['Duration'])),
-        axis=1
+    df['location_id'] = apply_per_unique(
+        df['Location'],
+        lambda location: generate_location_id(location, is_from_input_value(location))
     )
-    df['summary_id'] = df.apply(
-        lambda row: generate_summary_id(row['Summary'], is_from_input_value(row['Summary'])),
-        axis=1
-    )
-    df['source_id'] = df.apply(
-        lambda row: generate_source_id(row['Source'] if 'Source' in row else row['Company'], is_from_input_value(row['Source'] if 'Source' in row else row['Company'])),
-        axis=1
+    # Hours, duration and summary IDs also depend on their own column only: repeated values
+    # ("40", "6 maanden", boilerplate summaries) are cleaned and hashed once
+    df['hours_id'] = apply_per_unique(df['Hours'], lambda hours: generate_hours_id(hours, is_from_input_value(hours)))
+    df['duration_id'] = apply_per_unique(df['Duration'], lambda duration: generate_duration_id(duration, is_from_input_value(duration)))
+    df['summary_id'] = apply_per_unique(df['Summary'], lambda summary: generate_summary_id(summary, is_from_input_value(summary)))
+    source_column = 'Source' if 'Source' in df.columns else 'Company'
+    df['source_id'] = apply_per_unique(
+        df[source_column],
+        lambda source: generate_source_id(source, is_from_input_value(source))
     )
     
     # Generate true_duplicates ID (source + group + summary + company)
     # This identifies jobs that are truly identical: same title, same skills, from same source and company
     logging.info("Generating true_duplicates ID...")
-    df['true_duplicates'] = df.apply(
-        lambda row: hashlib.md5(f"{row['source_id']}_{row['group_id']}_{row['summary_id']}_{row['Company']}".encode()).hexdigest(),
-        axis=1
-    )
+    df['true_duplicates'] = hash_joined_columns(df, ['source_id', 'group_id', 'summary_id', 'Company'], '_')
     
     # Generate similarity matching IDs
     logging.info("Generating similarity matching IDs...")
     
     # Cross-platform duplicates: same title + same skills + same company (recruiters reposting same vacancy across platforms)
-    df['cross_platform_duplicates'] = df.apply(
-        lambda row: hashlib.md5(f"{row['group_id']}_{row['summary_id']}_{row['Company']}".encode()).hexdigest(),
-        axis=1
-    )
+    df['cross_platform_duplicates'] = hash_joined_columns(df, ['group_id', 'summary_id', 'Company'], '_')
+    
+    # Location clusters and recommendations are coarse grouping IDs: hashing the 64-bit (16 hex char)
+    # prefixes of the component IDs keeps the key within a single md5 block, collisions are negligible
     
     # Location clusters: same title + same location (jobs in same area with same role)
-    df['location_clusters'] = df.apply(
-        lambda row: hashlib.md5(f"{row['group_id']}_{row['location_id']}".encode()).hexdigest(),
-        axis=1
-    )
+    df['location_clusters'] = [
+        id_hexdigest(f"{group_id[:16]}_{location_id[:16]}")
+        for group_id, location_id in zip(df['group_id'], df['location_id'])
+    ]
     
     # Recommendations: same skills + same location (you might also be interested in this)
-    df['recommendations'] = df.apply(
-        lambda row: hashlib.md5(f"{row['summary_id']}_{row['location_id']}".encode()).hexdigest(),
-        axis=1
-    )
+    df['recommendations'] = [
+        id_hexdigest(f"{summary_id[:16]}_{location_id[:16]}")
+        for summary_id, location_id in zip(df['summary_id'], df['location_id'])
+    ]
     
     # Company location roles: same title + same source + same location (distinguish between companies posting same job in same location)
-    df['company_location_roles'] = df.apply(
-        lambda row: hashlib.md5(f"{row['group_id']}_{row['source_id']}_{row['location_id']}".encode()).hexdigest(),
-        axis=1
-    )
+    df['company_location_roles'] = hash_joined_columns(df, ['group_id', 'source_id', 'location_id'], '_')
+    
+    # Count distinct values once per ID column and reuse them for the result tables and logging
+    total_rows = len(df)
+    unique_counts = df[[
+        'location_id', 'hours_id', 'duration_id', 'summary_id', 'source_id',
+        'true_duplicates', 'cross_platform_duplicates', 'location_clusters',
+        'recommendations', 'company_location_roles'
+    ]].nunique()
     
     # Prepare ID generation results for table display
-    id_results = [
-        {
-            'id_type': 'Location ID',
-            'generated_count': len(df),
-            'from_input_count': df['location_id'].apply(lambda x: is_from_input_value(x)).sum(),
-            'from_historical_count': len(df) - df['location_id'].apply(lambda x: is_from_input_value(x)).sum(),
-            'collision_count': len(df) - df['location_id'].nunique(),
-            'success_pct': (df['location_id'].nunique() / len(df) * 100) if len(df) > 0 else 0
-        },
-        {
-            'id_type': 'Hours ID',
-            'generated_count': len(df),
-            'from_input_count': df['hours_id'].apply(lambda x: is_from_input_value(x)).sum(),
-            'from_historical_count': len(df) - df['hours_id'].apply(lambda x: is_from_input_value(x)).sum(),
-            'collision_count': len(df) - df['hours_id'].nunique(),
-            'success_pct': (df['hours_id'].nunique() / len(df) * 100) if len(df) > 0 else 0
-        },
-        {
-            'id_type': 'Duration ID',
-            'generated_count': len(df),
-            'from_input_count': df['duration_id'].apply(lambda x: is_from_input_value(x)).sum(),
-            'from_historical_count': len(df) - df['duration_id'].apply(lambda x: is_from_input_value(x)).sum(),
-            'collision_count': len(df) - df['duration_id'].nunique(),
-            'success_pct': (df['duration_id'].nunique() / len(df) * 100) if len(df) > 0 else 0
-        },
-        {
-            'id_type': 'Summary ID',
-            'generated_count': len(df),
-            'from_input_count': df['summary_id'].apply(lambda x: is_from_input_value(x)).sum(),
-            'from_historical_count': len(df) - df['summary_id'].apply(lambda x: is_from_input_value(x)).sum(),
-            'collision_count': len(df) - df['summary_id'].nunique(),
-            'success_pct': (df['summary_id'].nunique() / len(df) * 100) if len(df) > 0 else 0
-        },
-        {
-            'id_type': 'Source ID',
-            'generated_count': len(df),
-            'from_input_count': df['source_id'].apply(lambda x: is_from_input_value(x)).sum(),
-            'from_historical_count': len(df) - df['source_id'].apply(lambda x: is_from_input_value(x)).sum(),
-            'collision_count': len(df) - df['source_id'].nunique(),
-            'success_pct': (df['source_id'].nunique() / len(df) * 100) if len(df) > 0 else 0
-        }
-    ]
+    id_results = []
+    for column, id_type in [
+        ('location_id', 'Location ID'),
+        ('hours_id', 'Hours ID'),
+        ('duration_id', 'Duration ID'),
+        ('summary_id', 'Summary ID'),
+        ('source_id', 'Source ID')
+    ]:
+        from_input_count = int(df[column].apply(is_from_input_value).sum())
+        unique_count = unique_counts[column]
+        id_results.append({
+            'id_type': id_type,
+            'generated_count': total_rows,
+            'from_input_count': from_input_count,
+            'from_historical_count': total_rows - from_input_count,
+            'collision_count': total_rows - unique_count,
+            'success_pct': (unique_count / total_rows * 100) if total_rows > 0 else 0
+        })
     
     # Prepare duplicate detection results for table display
-    duplicate_results = [
-        {
-            'source': 'True Duplicates',
-            'total_count': len(df),
-            'duplicate_count': len(df) - df['true_duplicates'].nunique(),
-            'unique_count': df['true_duplicates'].nunique(),
-            'duplicate_pct': ((len(df) - df['true_duplicates'].nunique()) / len(df) * 100) if len(df) > 0 else 0,
-            'detection_method': 'Source + Group + Summary + Company'
-        },
-        {
-            'source': 'Cross-Platform',
-            'total_count': len(df),
-            'duplicate_count': len(df) - df['cross_platform_duplicates'].nunique(),
-            'unique_count': df['cross_platform_duplicates'].nunique(),
-            'duplicate_pct': ((len(df) - df['cross_platform_duplicates'].nunique()) / len(df) * 100) if len(df) > 0 else 0,
-            'detection_method': 'Group + Summary + Company'
-        },
-        {
-            'source': 'Location Clusters',
-            'total_count': len(df),
-            'duplicate_count': len(df) - df['location_clusters'].nunique(),
-            'unique_count': df['location_clusters'].nunique(),
-            'duplicate_pct': ((len(df) - df['location_clusters'].nunique()) / len(df) * 100) if len(df) > 0 else 0,
-            'detection_method': 'Group + Location'
-        }
-    ]
+    duplicate_results = []
+    for column, source_label, detection_method in [
+        ('true_duplicates', 'True Duplicates', 'Source + Group + Summary + Company'),
+        ('cross_platform_duplicates', 'Cross-Platform', 'Group + Summary + Company'),
+        ('location_clusters', 'Location Clusters', 'Group + Location')
+    ]:
+        unique_count = unique_counts[column]
+        duplicate_results.append({
+            'source': source_label,
+            'total_count': total_rows,
+            'duplicate_count': total_rows - unique_count,
+            'unique_count': unique_count,
+            'duplicate_pct': ((total_rows - unique_count) / total_rows * 100) if total_rows > 0 else 0,
+            'detection_method': detection_method
+        })
     
     # Log summary of ID generation
-    location_unique = df['location_id'].nunique()
-    hours_unique = df['hours_id'].nunique()
-    duration_unique = df['duration_id'].nunique()
-    summary_unique = df['summary_id'].nunique()
-    source_unique = df['source_id'].nunique()
-    true_duplicates_unique = df['true_duplicates'].nunique()
-    cross_platform_unique = df['cross_platform_duplicates'].nunique()
-    location_clusters_unique = df['location_clusters'].nunique()
-    recommendations_unique = df['recommendations'].nunique()
-    company_location_roles_unique = df['company_location_roles'].nunique()
-    logging.info(f"ID generation completed: {location_unique} unique locations, {hours_unique} unique hours, {duration_unique} unique durations, {summary_unique} unique summaries, {source_unique} unique sources, {true_duplicates_unique} unique true_duplicates")
-    logging.info(f"Business matching: {cross_platform_unique} cross-platform groups, {location_clusters_unique} location clusters, {recommendations_unique} recommendation groups, {company_location_roles_unique} company-location-role groups")
+    logging.info(f"ID generation completed: {unique_counts['location_id']} unique locations, {unique_counts['hours_id']} unique hours, {unique_counts['duration_id']} unique durations, {unique_counts['summary_id']} unique summaries, {unique_counts['source_id']} unique sources, {unique_counts['true_duplicates']} unique true_duplicates")
+    logging.info(f"Business matching: {unique_counts['cross_platform_duplicates']} cross-platform groups, {unique_counts['location_clusters']} location clusters, {unique_counts['recommendations']} recommendation groups, {unique_counts['company_location_roles']} company-location-role groups")
     
     df['date'] = timestamp()
     
     # Log summary of duplicate analysis (replaced verbose logging with table format)
-    duplicate_groups = df.groupby('group_id').size().reset_index(name='count')
-    duplicate_groups = duplicate_groups[duplicate_groups['count'] > 1]
-    
-    true_dup_counts = df.groupby('true_duplicates').size().reset_index(name='count')
-    true_duplicate_groups = true_dup_counts[true_dup_counts['count'] > 1]
+    duplicate_title_groups = int((df['group_id'].value_counts() > 1).sum())
+    true_duplicate_groups = int((df['true_duplicates'].value_counts() > 1).sum())
     
-    logging.info(f"Duplicate analysis: {len(duplicate_groups)} duplicate title groups, {len(true_duplicate_groups)} true duplicate groups")
+    logging.info(f"Duplicate analysis: {duplicate_title_groups} duplicate title groups, {true_duplicate_groups} true duplicate groups")
     
     # If we have historical data, preserve dates for existing records
     if historical_data is not None and not historical_data.empty:
-        for idx in df.index:
-            if df.loc[idx, 'UNIQUE_ID'] in set(historical_data['UNIQUE_ID']):
-                df.loc[idx, 'date'] = historical_data[
-                    historical_data['UNIQUE_ID'] == df.loc[idx, 'UNIQUE_ID']
-                ].iloc[0]['date']
+        # Build the UNIQUE_ID -> date lookup once (first historical match wins)
+        first_historical = historical_data.drop_duplicates(subset='UNIQUE_ID', keep='first')
+        historical_date_map = dict(zip(first_historical['UNIQUE_ID'], first_historical['date']))
+        historical_dates = df['UNIQUE_ID'].map(historical_date_map)
+        has_historical_date = historical_dates.notna()
+        df.loc[has_historical_date, 'date'] = historical_dates[has_historical_date]
     
     # Remove duplicates using UNIQUE_ID - COMMENTED OUT
     # duplicates_count = df.duplicated(subset=['UNIQUE_ID']).sum()
@@ -2149,18 +2392,17 @@ def merge_with_historical_data(new_data, historical_data):
     if historical_data.empty:
         return new_data
     
-    # Find records that already exist using UNIQUE_ID
-    existing_records = new_data['UNIQUE_ID'].isin(historical_data['UNIQUE_ID'])
+    # Find records that already exist using UNIQUE_ID (first historical match wins)
+    first_historical = historical_data.drop_duplicates(subset='UNIQUE_ID', keep='first')
+    historical_dates = new_data['UNIQUE_ID'].map(dict(zip(first_historical['UNIQUE_ID'], first_historical['date'])))
+    existing_records = historical_dates.notna()
     existing_count = existing_records.sum()
     
     if existing_count > 0:
         logging.info(f"Found {existing_count} records that already exist in historical data")
         
         # Update dates for existing records directly
-        for idx in new_data[existing_records].index:
-            matching_historical = historical_data[historical_data['UNIQUE_ID'] == new_data.loc[idx, 'UNIQUE_ID']]
-            if not matching_historical.empty:
-                new_data.loc[idx, 'date'] = matching_historical.iloc[0]['date']
+        new_data.loc[existing_records, 'date'] = historical_dates[existing_records]
         
         # Log some examples of preserved dates
         sample_size = min(3, existing_count)
@@ -2170,6 +2412,42 @@ def merge_with_historical_data(new_data, historical_data):
     
     return new_data
 
+def copy_upsert_to_postgres(df, table_name, replace_existing=False):
+    """
+    Bulk upsert a DataFrame straight into Postgres: COPY into a temporary staging table,
+    then a single INSERT ... ON CONFLICT ("UNIQUE_ID") DO UPDATE into the target table.
+    With replace_existing, target rows with a staged UNIQUE_ID are deleted first, so they are
+    replaced as a whole rather than merged (same as the REST path's pre-upsert delete).
+    Requires psycopg and SUPABASE_DB_URL. Returns the number of rows written.
+    """
+    columns = sql.SQL(', ').join(sql.Identifier(col) for col in df.columns)
+    updates = sql.SQL(', ').join(
+        sql.SQL('{col} = EXCLUDED.{col}').format(col=sql.Identifier(col))
+        for col in df.columns if col != 'UNIQUE_ID'
+    )
+    with psycopg.connect(SUPABASE_DB_URL) as conn:
+        with conn.cursor() as cur:
+            # Stage only the columns being copied: LIKE would also copy NOT NULL columns such as an
+            # identity id, which COPY leaves NULL because the identity generation is not copied
+            cur.execute(sql.SQL('CREATE TEMP TABLE allgigs_staging ON COMMIT DROP AS SELECT {columns} FROM {table} WITH NO DATA').format(
+                columns=columns, table=sql.Identifier(table_name)))
+            # Number staged rows in COPY order, so duplicate UNIQUE_IDs resolve to the last one (as in the REST upsert)
+            cur.execute('ALTER TABLE allgigs_staging ADD COLUMN staging_seq bigserial')
+            # Quote every field so empty strings stay empty strings instead of becoming NULL
+            with cur.copy(sql.SQL('COPY allgigs_staging ({columns}) FROM STDIN WITH (FORMAT csv)').format(columns=columns)) as copy:
+                copy.write(df.to_csv(index=False, header=False, quoting=csv.QUOTE_ALL))
+            if replace_existing:
+                cur.execute(sql.SQL(
+                    'DELETE FROM {table} t USING allgigs_staging s WHERE t."UNIQUE_ID" = s."UNIQUE_ID"'
+                ).format(table=sql.Identifier(table_name)))
+            cur.execute(sql.SQL(
+                'INSERT INTO {table} ({columns}) '
+                'SELECT DISTINCT ON ("UNIQUE_ID") {columns} FROM allgigs_staging '
+                'ORDER BY "UNIQUE_ID", staging_seq DESC '
+                'ON CONFLICT ("UNIQUE_ID") DO UPDATE SET {updates}'
+            ).format(table=sql.Identifier(table_name), columns=columns, updates=updates))
+            return cur.rowcount
+
 def supabase_upload(df, table_name, is_historical=False):
     """
     Upload data to Supabase.
@@ -2191,14 +2469,11 @@ def supabase_upload(df, table_name, is_historical=False):
         num_existing_before = len(existing_ids)
 
         # For each record, if UNIQUE_ID exists, keep the older date
-        updated_count = 0
-        for idx in df.index:
-            unique_id = df.loc[idx, 'UNIQUE_ID']
-            if unique_id in existing_dates:
-                old_date = existing_dates[unique_id]
-                if old_date < df.loc[idx, 'date']:
-                    df.loc[idx, 'date'] = old_date
-                updated_count += 1
+        existing_record_dates = df['UNIQUE_ID'].map(existing_dates)
+        has_existing = existing_record_dates.notna()
+        keep_older_date = has_existing & (existing_record_dates.where(has_existing, df['date']) < df['date'])
+        df.loc[keep_older_date, 'date'] = existing_record_dates[keep_older_date]
+        updated_count = int(has_existing.sum())
 
         # For NEW table: delete records not present in today's data
         deleted_count = 0
@@ -2268,55 +2543,58 @@ def supabase_upload(df, table_name, is_historical=False):
                 logging.info(f"Removing columns for historical table upload to {table_name}: {columns_to_remove}")
                 df = df.drop(columns=columns_to_remove)
         
-        # Handle NaN values before converting to records
-        df = df.fillna('')
-        # Replace any remaining NaN values with empty strings
-        for col in df.columns:
-            df[col] = df[col].astype(str).replace(['nan', 'NaN', 'None', 'none', 'NULL', 'null'], '')
+        # Handle NaN values before converting to records: stringify the whole frame once
+        # and blank out literal null markers with a single frame-level replace
+        df = df.fillna('').astype(str).replace(['nan', 'NaN', 'None', 'none', 'NULL', 'null'], '')
         
-        # Convert DataFrame to list of dictionaries
-        records = df.to_dict('records')
-        total_records = len(records)
-        new_records_total = 0
-        for i in range(0, total_records, BATCH_SIZE): # BATCH_SIZE is the main constant (500)
-            batch_df = df[i:i + BATCH_SIZE]
-            batch_data = batch_df.to_dict(orient='records')
-            batch_ids = batch_df['UNIQUE_ID'].tolist()
-            
-            delete_successful = True # Flag to track delete success
+        # One row per UNIQUE_ID, keeping the last as a sequential upsert would, so no key lands in two batches
+        df = df.drop_duplicates(subset='UNIQUE_ID', keep='last')
+        total_records = len(df)
+
+        def upload_batch(i):
+            """Delete (NEW table only) and upsert the batch starting at index i; returns the number of rows returned by the upsert."""
+            batch_data = records[i:i + BATCH_SIZE]
+            batch_ids = [record['UNIQUE_ID'] for record in batch_data]
 
             if table_name == NEW_TABLE: # Only perform pre-upsert batch delete for the NEW_TABLE
                 if batch_ids:
                     logging.info(f"Attempting to batch delete {len(batch_ids)} records from {NEW_TABLE} for batch starting at index {i}")
                     try:
-                        delete_response = supabase.table(table_name).delete().in_('UNIQUE_ID', batch_ids).execute()
-                        # logging.info(f"Delete response for batch {i // BATCH_SIZE + 1}: {delete_response}")
+                        execute_with_backoff(supabase.table(table_name).delete().in_('UNIQUE_ID', batch_ids))
                     except Exception as e_delete:
                         logging.error(f"ERROR DURING BATCH DELETE for batch {i // BATCH_SIZE + 1} of table {NEW_TABLE}.")
-                        # logging.error(f"Problematic batch_ids for delete: {batch_ids[:10]}...") # Log some IDs
                         logging.error(f"Delete operation error details: {str(e_delete)}")
-                        delete_successful = False 
                         raise # Re-raise to stop processing if batch delete fails
-                    if delete_successful:
-                        logging.info(f"Successfully batch deleted records for {NEW_TABLE} for batch starting at index {i} (if any were present).")
+                    logging.info(f"Successfully batch deleted records for {NEW_TABLE} for batch starting at index {i} (if any were present).")
                 else:
                     logging.info(f"Skipping batch delete for {NEW_TABLE} for batch starting at index {i} as batch_ids is empty.")
             # For HISTORICAL_TABLE, we don't do this pre-upsert delete.
 
-            if delete_successful: # True if delete succeeded OR if table_name was HISTORICAL_TABLE (delete skipped)
-                try:
-                    logging.info(f"Attempting to upsert {len(batch_data)} records to {table_name} for batch starting at index {i}")
-                    response = supabase.table(table_name).upsert(batch_data, on_conflict='UNIQUE_ID').execute()
-                    if hasattr(response, 'data'):
-                        new_records = len(response.data)
-                        new_records_total += new_records
-                    time.sleep(1)  # Rate limiting
-                except Exception as e_upsert:
-                    logging.error(f"Error during UPSERT for batch {i // BATCH_SIZE + 1} of table {table_name}.")
-                    logging.error(f"Upsert operation error details: {str(e_upsert)}")
-                    raise # Re-raising to see the error
-            else:
-                logging.warning(f"Skipping upsert for batch {i // BATCH_SIZE + 1} due to delete operation failure.")
+            try:
+                logging.info(f"Attempting to upsert {len(batch_data)} records to {table_name} for batch starting at index {i}")
+                response = execute_with_backoff(supabase.table(table_name).upsert(batch_data, on_conflict='UNIQUE_ID'))
+                return len(response.data) if hasattr(response, 'data') else 0
+            except Exception as e_upsert:
+                logging.error(f"Error during UPSERT for batch {i // BATCH_SIZE + 1} of table {table_name}.")
+                logging.error(f"Upsert operation error details: {str(e_upsert)}")
+                raise # Re-raising to see the error
+
+        new_records_total = 0
+        if SUPABASE_DB_URL and psycopg is not None:
+            # One COPY round-trip instead of one REST request per batch
+            logging.info(f"Bulk loading {total_records} records into {table_name} via COPY")
+            new_records_total = copy_upsert_to_postgres(df, table_name, replace_existing=(table_name == NEW_TABLE))
+        else:
+            # Convert DataFrame to list of dictionaries once; batches are plain list slices of it.
+            # The COPY path above streams the DataFrame directly and never needs this.
+            records = df.to_dict('records')
+            # UNIQUE_IDs are deduplicated above, so batches hold disjoint keys and historical upserts can be
+            # sent concurrently. The NEW table's delete + upsert batches run one at a time, so a delete never
+            # interleaves with another batch's upsert. Rate limiting is handled by execute_with_backoff.
+            workers = 1 if table_name == NEW_TABLE else UPLOAD_WORKERS
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for new_records in executor.map(upload_batch, range(0, total_records, BATCH_SIZE)):
+                    new_records_total += new_records
         
         # Prepare upload results for table display
         upload_result = {
@@ -2383,6 +2661,17 @@ def get_automation_details_from_supabase(supabase_client: Client, logger_param)
 # Global tracking for table format
 processing_results = []
 
+# Separator line used by the log session headers, summaries and tables
+_SEP120 = "=" * 120
+
+# Line templates for the session header, rotation notice and run summary (%-formatted)
+_TMPL_DATE = "📅 DATE: %s"
+_TMPL_TIME = "⏰ TIME: %s"
+_TMPL_DURATION = "⏱️  DURATION: %.1f seconds (%.1f minutes)"
+_TMPL_RECORDS = "• Total Records Processed: %d across %d batch files"
+_TMPL_BATCH_FILES = "• Batch Files Created: %d"
+_TMPL_PREVIOUS_SESSION = "📅 Previous Session: %s"
+
 def write_to_log_and_console(message):
     """Write message to both console and allgigs_v7.out.log file"""
     print(message)
@@ -2392,20 +2681,44 @@ def write_to_log_and_console(message):
     except Exception as e:
         print(f"Warning: Could not write to log file: {e}")
 
+# Sidecar file holding the number of sessions in allgigs_v7.out.log, so the log doesn't have to be re-read on every run
+SESSION_COUNT_FILE = 'allgigs_v7.out.log.sessions'
+
+def read_session_count():
+    """Return the number of sessions in allgigs_v7.out.log (0 if the log doesn't exist yet)"""
+    if not os.path.exists('allgigs_v7.out.log'):
+        return 0
+    try:
+        with open(SESSION_COUNT_FILE, 'r', encoding='utf-8') as count_file:
+            return int(count_file.read().strip())
+    except (FileNotFoundError, ValueError):
+        # No usable sidecar yet: count the "NEW LOG SESSION STARTED" entries once and cache the result
+        session_count = 0
+        with open('allgigs_v7.out.log', 'r', encoding='utf-8') as log_file:
+            for line in log_file:
+                if "🚀 NEW LOG SESSION STARTED" in line:
+                    session_count += 1
+        write_session_count(session_count)
+        return session_count
+
+def write_session_count(session_count):
+    """Persist the session count for allgigs_v7.out.log"""
+    try:
+        with open(SESSION_COUNT_FILE, 'w', encoding='utf-8') as count_file:
+            count_file.write(str(session_count))
+    except Exception as e:
+        print(f"Warning: Could not write session count file: {e}")
+
 def check_and_rotate_log_file():
     """Check if log file has 50+ runs and rotate if needed"""
     try:
-        # Count the number of "NEW LOG SESSION STARTED" entries
-        session_count = 0
-        try:
-            with open('allgigs_v7.out.log', 'r', encoding='utf-8') as log_file:
-                for line in log_file:
-                    if "🚀 NEW LOG SESSION STARTED" in line:
-                        session_count += 1
-        except FileNotFoundError:
-            # Log file doesn't exist yet, create it
+        if not os.path.exists('allgigs_v7.out.log'):
+            # Log file doesn't exist yet, it will be created by the session header
+            write_session_count(0)
             return
         
+        session_count = read_session_count()
+        
         # Show current log status
         print(f"📊 Current log file has {session_count} sessions (max: 50)")
         
@@ -2416,20 +2729,19 @@ def check_and_rotate_log_file():
             old_log_name = f'allgigs_v7.out.log.{timestamp}'
             
             # Rename current log file
-            import os
             os.rename('allgigs_v7.out.log', old_log_name)
             
             # Create new log file with rotation notice
             rotation_notice = [
-                "="*120,
+                _SEP120,
                 "🔄 LOG FILE ROTATED",
-                "="*120,
-                f"📅 DATE: {datetime.now().strftime('%Y-%m-%d')}",
-                f"⏰ TIME: {datetime.now().strftime('%H:%M:%S')}",
+                _SEP120,
+                _TMPL_DATE % datetime.now().strftime('%Y-%m-%d'),
+                _TMPL_TIME % datetime.now().strftime('%H:%M:%S'),
                 f"📊 REASON: Previous log file had {session_count} sessions (max: 50)",
                 f"📁 OLD LOG: {old_log_name}",
                 f"📁 NEW LOG: allgigs_v7.out.log",
-                "="*120,
+                _SEP120,
                 ""
             ]
             
@@ -2437,26 +2749,49 @@ def check_and_rotate_log_file():
                 for line in rotation_notice:
                     new_log.write(line + '\n')
             
+            write_session_count(0)
             print(f"🔄 Log file rotated: {old_log_name} -> allgigs_v7.out.log")
             
     except Exception as e:
         print(f"Warning: Could not rotate log file: {e}")
 
+# Status icons for the processing and upload tables (unknown statuses fall back to ❓ / ⚠️)
+STATUS_ICONS = {"Success": "✅", "Failed": "❌", "Skipped": "⏭️"}
+UPLOAD_STATUS_ICONS = {"Success": "✅", "Failed": "❌"}
+
+# Row template for the data source processing table (field stats are passed in by name)
+SOURCE_ROW_FMT = "{company:<20} {status_icon} {status:<8} {initial:<8} {final:<8} {dropped:<8} {success_pct:>7.1f}% {Title:<8} {URL:<8} {Location:<10} {Summary:<10} {rate:<8} {Hours:<8} {Duration:<10}"
+
 def print_simple_table(result_df=None):
     """Print processing results in enhanced table format with detailed reasons and field completion stats"""
     if not processing_results:
         return
     
     output = []
-    output.append("\n" + "="*120)
+    output.append("\n" + _SEP120)
     output.append("📊 DATA SOURCE PROCESSING RESULTS (Sorted by Success % - Lowest First)")
-    output.append("="*120)
+    output.append(_SEP120)
     
     # Enhanced header with status icons and field completion
     header = f"{'Source':<20} {'Status':<12} {'Initial':<8} {'Final':<8} {'Dropped':<8} {'Success %':<10} {'Title':<8} {'URL':<8} {'Location':<10} {'Summary':<10} {'Rate':<8} {'Hours':<8} {'Duration':<10}"
     output.append(header)
     output.append("-" * 120)
     
+    # Field completion percentages for every source in a single groupby pass
+    fields_to_check = ['Title', 'URL', 'Location', 'Summary', 'rate', 'Hours', 'Duration']
+    completion_by_source = {}
+    if result_df is not None:
+        present_fields = [field for field in fields_to_check if field in result_df.columns]
+        if present_fields:
+            # Count non-empty, non-null values (excluding "Not mentioned"), comparing raw arrays
+            # rather than building and aligning three intermediate boolean Series per field
+            completed = {}
+            for field in present_fields:
+                values = result_df[field].to_numpy()
+                completed[field] = pd.notna(values) & (values != 'Not mentioned') & (values != '')
+            completed = pd.DataFrame(completed, index=result_df.index)
+            completion_by_source = completed.groupby(result_df['Source']).mean().mul(100).to_dict('index')
+    
     # Calculate success percentages and create detailed reasons
     enhanced_results = []
     for result in processing_results:
@@ -2465,26 +2800,19 @@ def print_simple_table(result_df=None):
         initial = result.get('read_data', 0)
         final = result.get('processed', 0)
         dropped = result.get('dropped', 0)
-        success_pct = (final / initial * 100) if initial > 0 else 0
+        success_pct = result.get('success_pct', 0)
         
         # Calculate field completion statistics if result_df is available
         field_stats = {}
         if result_df is not None and status == "Success":
-            source_data = result_df[result_df['Source'] == company]
-            if len(source_data) > 0:
-                fields_to_check = ['Title', 'URL', 'Location', 'Summary', 'rate', 'Hours', 'Duration']
-                for field in fields_to_check:
-                    if field in source_data.columns:
-                        # Count non-empty, non-null values (excluding "Not mentioned")
-                        completed = source_data[field].notna() & (source_data[field] != 'Not mentioned') & (source_data[field] != '')
-                        completion_pct = (completed.sum() / len(source_data) * 100) if len(source_data) > 0 else 0
-                        field_stats[field] = f"{completion_pct:.0f}%"
-                    else:
-                        field_stats[field] = "0%"
-            else:
-                field_stats = {field: "0%" for field in ['Title', 'URL', 'Location', 'Summary', 'rate', 'Hours', 'Duration']}
+            source_completion = completion_by_source.get(company, {})
+            for field in fields_to_check:
+                if field in source_completion:
+                    field_stats[field] = f"{source_completion[field]:.0f}%"
+                else:
+                    field_stats[field] = "0%"
         else:
-            field_stats = {field: "N/A" for field in ['Title', 'URL', 'Location', 'Summary', 'rate', 'Hours', 'Duration']}
+            field_stats = {field: "N/A" for field in fields_to_check}
         
         enhanced_results.append({
             'company': company,
@@ -2497,22 +2825,14 @@ def print_simple_table(result_df=None):
         })
     
     # Sort by success percentage (lowest first)
-    enhanced_results.sort(key=lambda x: x['success_pct'])
+    enhanced_results.sort(key=itemgetter('success_pct'))
     
-    # Remove duplicates based on company name (keep the last occurrence)
-    seen_companies = set()
-    unique_results = []
+    # Remove duplicates based on company name (keep the last occurrence).
+    # Re-assigning a key keeps its original position, so the sort order is preserved.
+    results_by_company = {}
     for result in enhanced_results:
-        company = result['company']
-        if company not in seen_companies:
-            seen_companies.add(company)
-            unique_results.append(result)
-        else:
-            # Replace the previous entry with the current one (keep the last occurrence)
-            for i, existing_result in enumerate(unique_results):
-                if existing_result['company'] == company:
-                    unique_results[i] = result
-                    break
+        results_by_company[result['company']] = result
+    unique_results = list(results_by_company.values())
     
     # Data rows with better formatting
     for result in unique_results:
@@ -2524,17 +2844,9 @@ def print_simple_table(result_df=None):
         success_pct = result['success_pct']
         field_stats = result['field_stats']
         
-        # Status icons
-        if status == "Success":
-            status_icon = "✅"
-        elif status == "Failed":
-            status_icon = "❌"
-        elif status == "Skipped":
-            status_icon = "⏭️"
-        else:
-            status_icon = "❓"
+        status_icon = STATUS_ICONS.get(status, "❓")
         
-        row = f"{company:<20} {status_icon} {status:<8} {initial:<8} {final:<8} {dropped:<8} {success_pct:>7.1f}% {field_stats['Title']:<8} {field_stats['URL']:<8} {field_stats['Location']:<10} {field_stats['Summary']:<10} {field_stats['rate']:<8} {field_stats['Hours']:<8} {field_stats['Duration']:<10}"
+        row = SOURCE_ROW_FMT.format(company=company, status_icon=status_icon, status=status, initial=initial, final=final, dropped=dropped, success_pct=success_pct, **field_stats)
         output.append(row)
     
     output.append("-" * 120)
@@ -2546,8 +2858,7 @@ def print_simple_table(result_df=None):
     output.append("  • Higher percentages indicate better data quality")
     
     # Write all lines to both console and log
-    for line in output:
-        write_to_log_and_console(line)
+    write_to_log_and_console("\n".join(output))
 
 def print_summary_stats():
     """Print summary statistics"""
@@ -2555,27 +2866,37 @@ def print_summary_stats():
         return
     
     output = []
-    output.append("\n" + "="*120)
+    output.append("\n" + _SEP120)
     output.append("📈 SUMMARY STATISTICS")
-    output.append("="*120)
+    output.append(_SEP120)
     
     total_sources = len(processing_results)
-    successful_sources = sum(1 for r in processing_results if r['status'] == 'Success')
-    failed_sources = sum(1 for r in processing_results if r['status'] == 'Failed')
-    skipped_sources = sum(1 for r in processing_results if r['status'] == 'Skipped')
     
-    total_initial_rows = sum(r.get('read_data', 0) for r in processing_results)
-    total_final_rows = sum(r.get('processed', 0) for r in processing_results)
-    total_dropped_rows = sum(r.get('dropped', 0) for r in processing_results)
+    # Gather the per-source values into arrays once; all counters below are vectorized masks
+    statuses = np.array([r['status'] for r in processing_results])
+    read_data = np.array([r.get('read_data', 0) for r in processing_results])
+    processed = np.array([r.get('processed', 0) for r in processing_results])
+    dropped = np.array([r.get('dropped', 0) for r in processing_results])
+    success_pct = np.array([r.get('success_pct', 0) for r in processing_results], dtype=float)
+    
+    successful = statuses == 'Success'
+    successful_sources = int(np.count_nonzero(successful))
+    failed_sources = int(np.count_nonzero(statuses == 'Failed'))
+    skipped_sources = int(np.count_nonzero(statuses == 'Skipped'))
+    
+    total_initial_rows = int(read_data.sum())
+    total_final_rows = int(processed.sum())
+    total_dropped_rows = int(dropped.sum())
+    
+    # Calculate performance tiers: bucket 0 is <20%, 1 is 20-79%, 2 is >=80%
+    tiers = np.bincount(np.digitize(success_pct[successful], [20, 80]), minlength=3)
+    low_performers, medium_performers, high_performers = (int(count) for count in tiers)
+    complete_sources = int(np.count_nonzero(successful & (dropped == 0)))
+    partial_loss_sources = int(np.count_nonzero(successful & (dropped > 0)))
     
     success_rate = (successful_sources / total_sources * 100) if total_sources > 0 else 0
     data_retention_rate = (total_final_rows / total_initial_rows * 100) if total_initial_rows > 0 else 0
     
-    # Calculate performance tiers
-    high_performers = sum(1 for r in processing_results if r['status'] == 'Success' and (r.get('processed', 0) / r.get('read_data', 1) * 100) >= 80)
-    medium_performers = sum(1 for r in processing_results if r['status'] == 'Success' and 20 <= (r.get('processed', 0) / r.get('read_data', 1) * 100) < 80)
-    low_performers = sum(1 for r in processing_results if r['status'] == 'Success' and (r.get('processed', 0) / r.get('read_data', 1) * 100) < 20)
-    
     output.append(f"Total Sources: {total_sources}")
     output.append(f"Successful: {successful_sources} ({success_rate:.1f}%)")
     output.append(f"  ├─ High Performers (≥80%): {high_performers}")
@@ -2590,17 +2911,23 @@ def print_summary_stats():
     output.append(f"Data Retention Rate: {data_retention_rate:.1f}%")
     output.append("")
     output.append("📊 PERFORMANCE BREAKDOWN:")
-    output.append(f"• Sources with 100% success: {sum(1 for r in processing_results if r['status'] == 'Success' and r.get('dropped', 0) == 0)}")
-    output.append(f"• Sources with partial data loss: {sum(1 for r in processing_results if r['status'] == 'Success' and r.get('dropped', 0) > 0)}")
+    output.append(f"• Sources with 100% success: {complete_sources}")
+    output.append(f"• Sources with partial data loss: {partial_loss_sources}")
     output.append(f"• Sources completely filtered out: {skipped_sources}")
-    output.append("="*120)
+    output.append(_SEP120)
     
     # Write all lines to both console and log
-    for line in output:
-        write_to_log_and_console(line)
+    write_to_log_and_console("\n".join(output))
 
 def upload_processing_results_to_supabase():
-    """Upload processing results to Supabase table 'DATA SOURCE PROCESSING RESULTS' - overwrites entire table"""
+    """
+    Upload processing results to Supabase table 'DATA SOURCE PROCESSING RESULTS' - overwrites entire table.
+    By default all rows are deleted and the new ones inserted. With upsert_processing_results
+    enabled in config.json, rows are upserted on Source and rows for sources that are not in this
+    run are removed, so the table is never empty in between. That requires a one-time migration:
+        ALTER TABLE "DATA SOURCE PROCESSING RESULTS"
+            ADD CONSTRAINT "DATA SOURCE PROCESSING RESULTS_Source_key" UNIQUE ("Source");
+    """
     if not processing_results:
         return
 
@@ -2616,7 +2943,7 @@ def upload_processing_results_to_supabase():
             initial = result.get('read_data', 0)
             final = result.get('processed', 0)
             dropped = result.get('dropped', 0)
-            success_pct = (final / initial * 100) if initial > 0 else 0
+            success_pct = result.get('success_pct', 0)
 
             csv_data.append({
                 'Source': company,
@@ -2629,40 +2956,45 @@ def upload_processing_results_to_supabase():
                 'run_time': current_time
             })
 
-        # Create DataFrame and sort by success percentage (lowest first)
-        df = pd.DataFrame(csv_data)
-        df = df.sort_values('Success_Percentage', ascending=True)
-
-        # Handle NaN values before converting to records
-        df = df.fillna('')
-        for col in df.columns:
-            df[col] = df[col].astype(str).replace(['nan', 'NaN', 'None', 'none', 'NULL', 'null'], '')
-
-        # Convert DataFrame to list of dictionaries
-        records = df.to_dict('records')
+        # Sort by success percentage (lowest first) and stringify values, blanking null markers.
+        # One row per Source (keep the last occurrence), since an upsert conflicts on Source.
+        null_markers = {'nan', 'NaN', 'None', 'none', 'NULL', 'null'}
+        csv_data.sort(key=itemgetter('Success_Percentage'))
+        records_by_source = {}
+        for row in csv_data:
+            records_by_source[row['Source']] = {key: '' if str(value) in null_markers else str(value) for key, value in row.items()}
+        records = list(records_by_source.values())
         total_records = len(records)
 
-        # First, delete all existing records from the table
-        logging.info(f"Deleting all existing records from 'DATA SOURCE PROCESSING RESULTS' table")
-        supabase.table('DATA SOURCE PROCESSING RESULTS').delete().neq('id', 0).execute()
+        if not UPSERT_PROCESSING_RESULTS:
+            # First, delete all existing records from the table
+            logging.info(f"Deleting all existing records from 'DATA SOURCE PROCESSING RESULTS' table")
+            execute_with_backoff(supabase.table('DATA SOURCE PROCESSING RESULTS').delete().neq('id', 0))
 
-        # Then upload new records to Supabase in batches
+        # Then upload new records to Supabase: one request when small enough, otherwise in batches
+        batch_size = total_records if 0 < total_records <= SINGLE_INSERT_LIMIT else BATCH_SIZE
         new_records_total = 0
-        for i in range(0, total_records, BATCH_SIZE):
-            batch_df = df[i:i + BATCH_SIZE]
-            batch_data = batch_df.to_dict(orient='records')
+        for i in range(0, total_records, batch_size):
+            batch_data = records[i:i + batch_size]
+            table = supabase.table('DATA SOURCE PROCESSING RESULTS')
 
             try:
                 logging.info(f"Uploading {len(batch_data)} processing results to Supabase table 'DATA SOURCE PROCESSING RESULTS' for batch starting at index {i}")
-                response = supabase.table('DATA SOURCE PROCESSING RESULTS').insert(batch_data).execute()
+                query = table.upsert(batch_data, on_conflict='Source') if UPSERT_PROCESSING_RESULTS else table.insert(batch_data)
+                response = execute_with_backoff(query)
                 if hasattr(response, 'data'):
                     new_records = len(response.data)
                     new_records_total += new_records
-                time.sleep(1)  # Rate limiting
             except Exception as e_upsert:
-                logging.error(f"Error during processing results upload for batch {i // BATCH_SIZE + 1}: {str(e_upsert)}")
+                logging.error(f"Error during processing results upload for batch {i // batch_size + 1}: {str(e_upsert)}")
                 raise
 
+        if UPSERT_PROCESSING_RESULTS:
+            # Remove rows for sources that were not part of this run, so the table still mirrors the latest run only
+            current_sources = [record['Source'] for record in records]
+            logging.info(f"Removing processing results for sources not in this run from 'DATA SOURCE PROCESSING RESULTS' table")
+            execute_with_backoff(supabase.table('DATA SOURCE PROCESSING RESULTS').delete().not_.in_('Source', current_sources))
+
         logging.info(f"Successfully uploaded {new_records_total} processing results to Supabase table 'DATA SOURCE PROCESSING RESULTS' (table overwritten)")
 
     except Exception as e:
@@ -2673,20 +3005,19 @@ def print_supabase_upsert_table(upload_results):
     """Print Supabase upload results in table format"""
     if not upload_results:
         output = []
-        output.append("\n" + "="*120)
+        output.append("\n" + _SEP120)
         output.append("🗄️  SUPABASE UPLOAD RESULTS")
-        output.append("="*120)
+        output.append(_SEP120)
         output.append("No upload results to display.")
         output.append("-" * 120)
         
-        for line in output:
-            write_to_log_and_console(line)
+        write_to_log_and_console("\n".join(output))
         return
     
     output = []
-    output.append("\n" + "="*120)
+    output.append("\n" + _SEP120)
     output.append("🗄️  SUPABASE UPLOAD RESULTS")
-    output.append("="*120)
+    output.append(_SEP120)
     
     header = f"{'Table':<25} {'Status':<12} {'Before':<8} {'Deleted':<8} {'Upserted':<10} {'New':<8} {'Updated':<10} {'Final':<8}"
     output.append(header)
@@ -2702,13 +3033,7 @@ def print_supabase_upsert_table(upload_results):
         updated_count = result.get('updated_count', 0)
         final_count = result.get('final_count', 0)
         
-        # Status icons
-        if status == "Success":
-            status_icon = "✅"
-        elif status == "Failed":
-            status_icon = "❌"
-        else:
-            status_icon = "⚠️"
+        status_icon = UPLOAD_STATUS_ICONS.get(status, "⚠️")
         
         row = f"{table_name:<25} {status_icon} {status:<8} {before_count:<8} {deleted_count:<8} {upserted_count:<10} {new_count:<8} {updated_count:<10} {final_count:<8}"
         output.append(row)
@@ -2716,8 +3041,7 @@ def print_supabase_upsert_table(upload_results):
     output.append("-" * 120)
     
     # Write all lines to both console and log
-    for line in output:
-        write_to_log_and_console(line)
+    write_to_log_and_console("\n".join(output))
 
 def print_duplicates_table(duplicate_results):
     """Print duplicate detection results in table format"""
@@ -2725,9 +3049,9 @@ def print_duplicates_table(duplicate_results):
         return
     
     output = []
-    output.append("\n" + "="*120)
+    output.append("\n" + _SEP120)
     output.append("🔄 DUPLICATE DETECTION RESULTS")
-    output.append("="*120)
+    output.append(_SEP120)
     
     header = f"{'Source':<20} {'Total':<8} {'Duplicates':<12} {'Unique':<8} {'Duplicate %':<12} {'Detection Method':<20}"
     output.append(header)
@@ -2747,8 +3071,7 @@ def print_duplicates_table(duplicate_results):
     output.append("-" * 120)
     
     # Write all lines to both console and log
-    for line in output:
-        write_to_log_and_console(line)
+    write_to_log_and_console("\n".join(output))
 
 def print_id_generation_table(id_results):
     """Print ID generation results in table format"""
@@ -2756,9 +3079,9 @@ def print_id_generation_table(id_results):
         return
     
     output = []
-    output.append("\n" + "="*120)
+    output.append("\n" + _SEP120)
     output.append("🆔 ID GENERATION RESULTS")
-    output.append("="*120)
+    output.append(_SEP120)
     
     header = f"{'ID Type':<20} {'Generated':<10} {'From Input':<12} {'From Historical':<15} {'Collisions':<10} {'Success %':<10}"
     output.append(header)
@@ -2778,41 +3101,190 @@ def print_id_generation_table(id_results):
     output.append("-" * 120)
     
     # Write all lines to both console and log
-    for line in output:
-        write_to_log_and_console(line)
+    write_to_log_and_console("\n".join(output))
+
+def process_company(row):
+    """
+    Read one source CSV from automation_details and run it through freelance_directory.
+    Returns (processing_result, company_df or None, failure) where failure is None or a
+    (message, reason, broken_url or None) tuple for the caller's error summary.
+    """
+    try:
+        company_name = row['Company_name']
+        url_link = row['Path']
+
+        # Initialize result tracking for table
+        processing_result = {
+            'company': company_name,
+            'source': 'CSV',
+            'read_data': 0,
+            'dropped': 0,
+            'processed': 0,
+            'success_pct': 0,
+            'status': 'Processing',
+            'drop_reason': ''
+        }
+
+        # Add a minimal title before processing each company
+        logging.info(f"Processing: {company_name}")
+        
+        files_read = None
+        read_successful = False
+        csv_is_empty_or_no_data = False # Flag for this specific condition
+
+        # Check file size once for large files
+        file_size = os.path.getsize(url_link) if os.path.exists(url_link) else 0
+        file_size_mb = file_size / (1024 * 1024)
+        
+        separators = [',', ';', '\t']
+        for separator in separators:
+            try:
+                # Peek at the first rows to pick the separator before the full (possibly chunked) read:
+                # skip one that can't parse the file or leaves a single column while others remain
+                peek = pd.read_csv(url_link, sep=separator, nrows=5, dtype=str)
+                if peek.shape[1] <= 1 and separator != separators[-1]:
+                    continue
+                
+                if file_size_mb > 10:  # If file is larger than 10MB, use chunking
+                    logging.info(f"INFO: {company_name} - Large CSV file detected ({file_size_mb:.1f}MB). Processing in chunks...")
+                    
+                    # Read CSV in chunks
+                    chunk_size = 5000  # Process 5000 rows at a time
+                    all_chunks = []
+                    
+                    for chunk in pd.read_csv(url_link, sep=separator, chunksize=chunk_size, dtype=str):
+                        if chunk.empty:
+                            continue
+                        
+                        # Process each chunk: cells are already strings, so blank out pandas' NA values and literal null markers
+                        chunk_processed = chunk.fillna('').replace(['nan', 'NaN', 'None', 'none'], '')
+                        
+                        all_chunks.append(chunk_processed)
+                        
+                        # Log progress for large files
+                        if len(all_chunks) % 10 == 0:  # Every 50,000 rows
+                            logging.info(f"INFO: {company_name} - Processed {len(all_chunks) * chunk_size:,} rows...")
+                    
+                    if not all_chunks:
+                        logging.info(f"INFO: {company_name} - CSV file contains no data rows ({url_link}). Skipping.")
+                        csv_is_empty_or_no_data = True
+                        break
+                    
+                    # Combine all chunks
+                    files_read = pd.concat(all_chunks, ignore_index=True)
+                    logging.info(f"INFO: {company_name} - Successfully loaded {len(files_read):,} rows from large CSV file.")
+                    
+                else:
+                    # Normal processing for smaller files
+                    temp_df = pd.read_csv(url_link, sep=separator, dtype=str)
+                    
+                    if temp_df.empty: # CSV has headers but no data rows
+                        logging.info(f"INFO: {company_name} - CSV file contains no data rows ({url_link}). Skipping.")
+                        csv_is_empty_or_no_data = True
+                        break # Stop trying separators, we've identified the state
+
+                    # If we reach here, CSV has data. Process it.
+                    # Cells are read as strings, so only NA values and literal null markers need blanking
+                    files_read = temp_df.fillna('').replace(['nan', 'NaN', 'None', 'none'], '')
+                read_successful = True
+                break # Successfully read and processed
+
+            except pd.errors.EmptyDataError: # CSV is completely empty (no headers, no data)
+                logging.info(f"INFO: {company_name} - CSV file is completely empty ({url_link}). Skipping.")
+                csv_is_empty_or_no_data = True
+                break # Stop trying separators
+
+            except Exception: # Other read errors (e.g., file not found, malformed)
+                continue
+        
+        if csv_is_empty_or_no_data:
+            processing_result.update({
+                'status': 'Skipped',
+                'drop_reason': 'CSV file contains no data rows'
+            })
+            logging.info("") # Add an empty line for separation
+            return processing_result, None, None
+
+        if not read_successful: # Implies all separators failed with "other" exceptions
+            processing_result.update({
+                'status': 'Failed',
+                'drop_reason': 'Could not read or parse CSV'
+            })
+            msg = f"FAILED: {company_name} - Could not read or parse CSV ({url_link}) after trying all separators."
+            logging.error(msg)
+            logging.info("") # Add an empty line
+            return processing_result, None, (msg, f"Could not read or parse CSV ({url_link})", url_link)
+        
+        # If we reach here, files_read is a populated DataFrame
+        processing_result['read_data'] = len(files_read)
+        company_df = freelance_directory(files_read, company_name)
+
+        if company_df.empty:
+            processing_result.update({
+                'status': 'Skipped',
+                'dropped': processing_result['read_data'],
+                'processed': 0,
+                'drop_reason': 'No data remained after processing'
+            })
+            return processing_result, None, None # No data after cleaning
+
+        # If we reach here, company_df is not empty
+        processing_result.update({
+            'status': 'Success',
+            'processed': len(company_df),
+            'dropped': processing_result['read_data'] - len(company_df),
+            'success_pct': (len(company_df) / processing_result['read_data'] * 100) if processing_result['read_data'] > 0 else 0,
+            'drop_reason': 'Successfully processed'
+        })
+        return processing_result, company_df, None
+    
+    except Exception as e:
+        msg = f"FAILED: {company_name} - {str(e)}"
+        logging.error(msg)
+        
+        # Update processing result with failure reason
+        processing_result.update({
+            'status': 'Failed',
+            'drop_reason': str(e)[:50]  # Truncate error message
+        })
+        
+        # Add an empty line after each company
+        logging.info("")
+        return processing_result, None, (msg, str(e), None)
 
 def main():
     global processing_results
     # Reset processing_results for new run
     processing_results = []
-    error_messages = []  # Collect error messages for summary
+    error_counts = Counter()  # Collect error messages (with occurrence counts) for summary
     broken_urls = []     # Collect broken URLs for summary
-    source_failures = [] # Collect (company, reason) for summary
+    source_failures = defaultdict(Counter) # Collect company -> reason counts for summary
     
     # Initialize tracking variables for enhanced tables
     upload_results = []
     duplicate_results = []
     id_results = []
+    result = pd.DataFrame() # Combined data; stays empty if the run fails before any source is processed
     try:
         start_time = time.time()
         
         # Create session header in log file
         session_header = [
-            "="*120,
+            _SEP120,
             "🚀 NEW LOG SESSION STARTED",
-            "="*120,
-            f"📅 DATE: {datetime.now().strftime('%Y-%m-%d')}",
-            f"⏰ TIME: {datetime.now().strftime('%H:%M:%S')}",
+            _SEP120,
+            _TMPL_DATE % datetime.now().strftime('%Y-%m-%d'),
+            _TMPL_TIME % datetime.now().strftime('%H:%M:%S'),
             "🔄 SESSION: AllGigs V7 Processing Started",
-            "="*120,
+            _SEP120,
             ""
         ]
         
         # Check if log file needs rotation before starting new session
         check_and_rotate_log_file()
         
-        for line in session_header:
-            write_to_log_and_console(line)
+        write_to_log_and_console("\n".join(session_header))
+        write_session_count(read_session_count() + 1)
         
         logging.info("Script started.")
 
@@ -2836,167 +3308,36 @@ def main():
         except Exception as e:
             msg = f"FAILED: Historical data - {e}"
             logging.warning(msg)
-            error_messages.append(msg)
-            source_failures.append(("Historical data", str(e)))
+            error_counts[msg] += 1
+            source_failures["Historical data"][str(e)] += 1
             historical_data = pd.DataFrame()
         
-        result = pd.DataFrame()
+        result_parts = [] # Per-company frames, concatenated once after the loop
         
-        # Process each company from the automation details
-        for index, row in automation_details.iterrows():
-            try:
-                company_name = row['Company_name']
-                url_link = row['Path']
-
-                # Initialize result tracking for table
-                processing_result = {
-                    'company': company_name,
-                    'source': 'CSV',
-                    'read_data': 0,
-                    'dropped': 0,
-                    'processed': 0,
-                    'status': 'Processing',
-                    'drop_reason': ''
-                }
-
-                # Add a minimal title before processing each company
-                logging.info(f"Processing: {company_name}")
-                
-                files_read = None
-                read_successful = False
-                csv_is_empty_or_no_data = False # Flag for this specific condition
-
-                for separator in [',', ';', '\t']:
-                    try:
-                        # Check file size first for large files
-                        import os
-                        file_size = os.path.getsize(url_link) if os.path.exists(url_link) else 0
-                        file_size_mb = file_size / (1024 * 1024)
-                        
-                        if file_size_mb > 10:  # If file is larger than 10MB, use chunking
-                            logging.info(f"INFO: {company_name} - Large CSV file detected ({file_size_mb:.1f}MB). Processing in chunks...")
-                            
-                            # Read CSV in chunks
-                            chunk_size = 5000  # Process 5000 rows at a time
-                            all_chunks = []
-                            
-                            for chunk in pd.read_csv(url_link, sep=separator, chunksize=chunk_size):
-                                if chunk.empty:
-                                    continue
-                                
-                                # Process each chunk
-                                chunk_processed = chunk.fillna('')
-                                for col in chunk_processed.columns:
-                                    chunk_processed[col] = chunk_processed[col].astype(str).replace(['nan', 'NaN', 'None', 'none'], '')
-                                
-                                all_chunks.append(chunk_processed)
-                                
-                                # Log progress for large files
-                                if len(all_chunks) % 10 == 0:  # Every 50,000 rows
-                                    logging.info(f"INFO: {company_name} - Processed {len(all_chunks) * chunk_size:,} rows...")
-                            
-                            if not all_chunks:
-                                logging.info(f"INFO: {company_name} - CSV file contains no data rows ({url_link}). Skipping.")
-                                csv_is_empty_or_no_data = True
-                                break
-                            
-                            # Combine all chunks
-                            files_read = pd.concat(all_chunks, ignore_index=True)
-                            logging.info(f"INFO: {company_name} - Successfully loaded {len(files_read):,} rows from large CSV file.")
-                            
-                        else:
-                            # Normal processing for smaller files
-                            temp_df = pd.read_csv(url_link, sep=separator)
-                            
-                            if temp_df.empty: # CSV has headers but no data rows
-                                logging.info(f"INFO: {company_name} - CSV file contains no data rows ({url_link}). Skipping.")
-                                csv_is_empty_or_no_data = True
-                                break # Stop trying separators, we've identified the state
-
-                            # If we reach here, CSV has data. Process it.
-                            files_read = temp_df.fillna('')
-                            for col in files_read.columns:
-                                files_read[col] = files_read[col].astype(str).replace(['nan', 'NaN', 'None', 'none'], '')
-                        read_successful = True
-                        break # Successfully read and processed
-
-                    except pd.errors.EmptyDataError: # CSV is completely empty (no headers, no data)
-                        logging.info(f"INFO: {company_name} - CSV file is completely empty ({url_link}). Skipping.")
-                        csv_is_empty_or_no_data = True
-                        break # Stop trying separators
-
-                    except Exception: # Other read errors (e.g., file not found, malformed)
-                        continue
-                
-                if csv_is_empty_or_no_data:
-                    processing_result.update({
-                        'status': 'Skipped',
-                        'drop_reason': 'CSV file contains no data rows'
-                    })
-                    processing_results.append(processing_result)
-                    logging.info("") # Add an empty line for separation
-                    continue # Skip to the next company
-
-                if not read_successful: # Implies all separators failed with "other" exceptions
-                    processing_result.update({
-                        'status': 'Failed',
-                        'drop_reason': 'Could not read or parse CSV'
-                    })
-                    processing_results.append(processing_result)
-                    msg = f"FAILED: {company_name} - Could not read or parse CSV ({url_link}) after trying all separators."
-                    logging.error(msg)
-                    error_messages.append(msg)
-                    broken_urls.append((company_name, url_link))
-                    source_failures.append((company_name, f"Could not read or parse CSV ({url_link})"))
-                    logging.info("") # Add an empty line
-                    continue
-                
-                # If we reach here, files_read is a populated DataFrame
-                processing_result['read_data'] = len(files_read)
-                company_df = freelance_directory(files_read, company_name)
-
-                if company_df.empty:
-                    processing_result.update({
-                        'status': 'Skipped',
-                        'dropped': processing_result['read_data'],
-                        'processed': 0,
-                        'drop_reason': 'No data remained after processing'
-                    })
-                    processing_results.append(processing_result)
-                    continue # Skip to the next company if no data after cleaning
-
-                # If we reach here, company_df is not empty
-                processing_result.update({
-                    'status': 'Success',
-                    'processed': len(company_df),
-                    'dropped': processing_result['read_data'] - len(company_df),
-                    'drop_reason': 'Successfully processed'
-                })
+        # Process each company from the automation details, one at a time by default. Sources are
+        # independent until the final concat, so company_workers > 1 (opt-in) reads and cleans them
+        # concurrently; results are merged in order either way.
+        rows = [row for _, row in automation_details.iterrows()]
+        with ThreadPoolExecutor(max_workers=COMPANY_WORKERS) as executor:
+            for processing_result, company_df, failure in executor.map(process_company, rows):
                 processing_results.append(processing_result)
-                result = pd.concat([result, company_df], ignore_index=True)
-            
-            except Exception as e:
-                msg = f"FAILED: {company_name} - {str(e)}"
-                logging.error(msg)
-                error_messages.append(msg)
-                source_failures.append((company_name, str(e)))
-                
-                # Update processing result with failure reason
-                processing_result.update({
-                    'status': 'Failed',
-                    'drop_reason': str(e)[:50]  # Truncate error message
-                })
-                processing_results.append(processing_result)
-                
-                # Add an empty line after each company
-                logging.info("")
-                continue
-
+                if company_df is not None:
+                    result_parts.append(company_df)
+                if failure:
+                    msg, reason, broken_url = failure
+                    error_counts[msg] += 1
+                    source_failures[processing_result['company']][reason] += 1
+                    if broken_url:
+                        broken_urls.append((processing_result['company'], broken_url))
+
+        if result_parts:
+            result = pd.concat(result_parts, ignore_index=True)
+        
         if result.empty:
             msg = "FAILED: No data collected from any source"
             logging.error(msg)
-            error_messages.append(msg)
-            source_failures.append(("ALL", "No data collected from any source"))
+            error_counts[msg] += 1
+            source_failures["ALL"]["No data collected from any source"] += 1
             return
         
         # Prepare data with dates and IDs
@@ -3053,19 +3394,22 @@ def main():
         logging.info(f"🇫🇷 FRENCH JOBS: {french_count} → 'french freelance jobs' table")
         logging.info(f"🌍 NON-FRENCH JOBS: {non_french_count} → 'Allgigs_All_vacancies_NEW' table")
         
+        # Group by source once; the French breakdown is a subset of the same counts
+        source_counts = result['Source'].value_counts()
+        all_sources_in_data = source_counts.to_dict()
+        
         if french_count > 0:
-            french_sources_found = french_jobs['Source'].value_counts().to_dict()
+            french_source_mask = source_counts.index.astype(str).str.lower().str.strip().isin(french_sources_normalized)
+            french_sources_found = source_counts[french_source_mask].to_dict()
             logging.info(f"🇫🇷 French sources found: {french_sources_found}")
             
             # Debug: Show all unique sources in the data for comparison
-            all_sources_in_data = result['Source'].value_counts().to_dict()
             logging.info(f"🔍 All sources in data: {list(all_sources_in_data.keys())}")
             logging.info(f"🔍 Expected French sources: {french_sources}")
         else:
             logging.info("🇫🇷 No French jobs found in current data")
             
             # Debug: Show all unique sources in the data for comparison
-            all_sources_in_data = result['Source'].value_counts().to_dict()
             logging.info(f"🔍 All sources in data: {list(all_sources_in_data.keys())}")
             logging.info(f"🔍 Expected French sources: {french_sources}")
             logging.info(f"🔍 Normalized French sources: {french_sources_normalized}")
@@ -3073,7 +3417,7 @@ def main():
         logging.info("="*80)
         
         # Only upload to Supabase if there are no errors, source failures, or broken URLs
-        if error_messages or source_failures or broken_urls:
+        if error_counts or source_failures or broken_urls:
             if broken_urls:
                 logging.error("Upload to Supabase skipped due to broken URLs. See error summary above.")
             else:
@@ -3185,88 +3529,82 @@ def main():
     except Exception as e:
         msg = f"FAILED: Main process - {str(e)}"
         logging.error(msg)
-        error_messages.append(msg)
-        source_failures.append(("Main process", str(e)))
+        error_counts[msg] += 1
+        source_failures["Main process"][str(e)] += 1
         raise
     finally:
-        # Print/log concise error summary
-        if error_messages or broken_urls or source_failures:
-            from collections import Counter
-            error_counts = Counter(error_messages)
-            logging.info("\n--- Error Summary ---")
-            for err, count in error_counts.items():
-                logging.info(f"{err} ({count} time{'s' if count > 1 else ''})")
-            if broken_urls:
-                logging.info("\n--- Broken URLs ---")
-                for company, url in broken_urls:
-                    logging.info(f"{company}: {url}")
-            if source_failures:
-                logging.info("\n--- Source Failure Summary ---")
-                from collections import defaultdict
-                fail_dict = defaultdict(list)
-                for company, reason in source_failures:
-                    fail_dict[company].append(reason)
-                for company, reasons in fail_dict.items():
-                    for reason in set(reasons):
-                        logging.info(f"{company}: {reason} ({reasons.count(reason)} time{'s' if reasons.count(reason) > 1 else ''})")
-        else:
-            logging.info("\n--- Error Summary ---\nNo errors occurred.")
-        
-        # Add session summary to log
-        end_time = time.time()
-        duration = end_time - start_time
-        
-        session_summary = [
-            "",
-            "="*120,
-            "📊 RECENT ALLGIGS V7 RUN SUMMARY",
-            "="*120,
-            f"📅 DATE: {datetime.now().strftime('%Y-%m-%d')}",
-            f"⏰ TIME: {datetime.now().strftime('%H:%M:%S')}",
-            f"⏱️  DURATION: {duration:.1f} seconds ({duration/60:.1f} minutes)",
-            "="*120,
-            ""
-        ]
-        
-        # Determine overall status
-        if error_messages or source_failures or broken_urls:
-            session_summary.append("❌ PROCESSING COMPLETED WITH ERRORS")
-            if upload_results and any(r.get('status') == 'Failed' for r in upload_results):
-                session_summary.append("❌ SUPABASE UPLOAD FAILED")
-            session_summary.append("📁 DATA SAVED TO LOCAL BATCH FILES")
-        else:
-            session_summary.append("✅ PROCESSING COMPLETED SUCCESSFULLY")
-            if upload_results and all(r.get('status') == 'Success' for r in upload_results):
-                session_summary.append("✅ SUPABASE UPLOAD SUCCESSFUL")
+        has_errors = bool(error_counts or source_failures or broken_urls)
+        
+        # Print/log concise error summary (only formatted when INFO records will actually be emitted)
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            if has_errors:
+                logging.info("\n--- Error Summary ---")
+                for err, count in error_counts.items():
+                    logging.info(f"{err} ({count} time{'s' if count > 1 else ''})")
+                if broken_urls:
+                    logging.info("\n--- Broken URLs ---")
+                    for company, url in broken_urls:
+                        logging.info(f"{company}: {url}")
+                if source_failures:
+                    logging.info("\n--- Source Failure Summary ---")
+                    for company, reasons in source_failures.items():
+                        for reason, count in reasons.items():
+                            logging.info(f"{company}: {reason} ({count} time{'s' if count > 1 else ''})")
             else:
-                session_summary.append("❌ SUPABASE UPLOAD FAILED")
-            session_summary.append("📁 DATA SAVED TO LOCAL BATCH FILES")
-        
-        session_summary.extend([
-            "",
-            "📈 PROCESSING RESULTS:",
-            f"• Total Records Processed: {len(result) if 'result' in locals() else 0} across {len(processing_results)} batch files",
-            f"• Batch Files Created: {len(processing_results)}",
-            ""
-        ])
-        
-        if error_messages:
-            session_summary.extend([
-                "🚨 UPLOAD ISSUE DETAILS:",
-                "• Error: Various processing errors occurred",
-                "• Impact: Some data may not have been processed correctly",
-                "• Resolution: Check error summary above for details"
-            ])
-        
-        session_summary.extend([
-            "",
-            f"📅 Previous Session: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            "="*120,
-            ""
-        ])
+                logging.info("\n--- Error Summary ---\nNo errors occurred.")
+        
+        # Add session summary to log (skipped entirely when INFO output is disabled; no early
+        # return here, since returning from a finally block would swallow a pending exception)
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            duration = time.time() - start_time
+            duration_min = duration / 60.0
+            now = datetime.now()
+        
+            # Determine overall status (upload statuses are tallied in a single pass)
+            upload_statuses = Counter(r.get('status') for r in upload_results)
+            if has_errors:
+                status_lines = ["❌ PROCESSING COMPLETED WITH ERRORS"]
+                if upload_statuses['Failed']:
+                    status_lines.append("❌ SUPABASE UPLOAD FAILED")
+            else:
+                status_lines = ["✅ PROCESSING COMPLETED SUCCESSFULLY"]
+                if upload_results and upload_statuses['Success'] == len(upload_results):
+                    status_lines.append("✅ SUPABASE UPLOAD SUCCESSFUL")
+                else:
+                    status_lines.append("❌ SUPABASE UPLOAD FAILED")
+        
+            # Build the whole summary in one list literal
+            session_summary = [
+                "",
+                _SEP120,
+                "📊 RECENT ALLGIGS V7 RUN SUMMARY",
+                _SEP120,
+                _TMPL_DATE % now.strftime('%Y-%m-%d'),
+                _TMPL_TIME % now.strftime('%H:%M:%S'),
+                _TMPL_DURATION % (duration, duration_min),
+                _SEP120,
+                "",
+                *status_lines,
+                "📁 DATA SAVED TO LOCAL BATCH FILES",
+                "",
+                "📈 PROCESSING RESULTS:",
+                _TMPL_RECORDS % (len(result), len(processing_results)),
+                _TMPL_BATCH_FILES % len(processing_results),
+                "",
+                *([
+                    "🚨 UPLOAD ISSUE DETAILS:",
+                    "• Error: Various processing errors occurred",
+                    "• Impact: Some data may not have been processed correctly",
+                    "• Resolution: Check error summary above for details"
+                ] if error_counts else []),
+                "",
+                _TMPL_PREVIOUS_SESSION % now.strftime('%Y-%m-%d %H:%M:%S'),
+                _SEP120,
+                ""
+            ]
         
-        for line in session_summary:
-            write_to_log_and_console(line)
+            # One console print and one log file write for the whole summary
+            write_to_log_and_console("\n".join(session_summary))
 
 if __name__ == "__main__":
     main() 
@@ -0,0 +1,42 @@
+import importlib.util
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+pd = pytest.importorskip('pandas')
+np = pytest.importorskip('numpy')
+pytest.importorskip('supabase')
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture(scope='module')
+def allgigs(tmp_path_factory):
+    """Import the script from a scratch directory, since it reads its JSON config and writes logs in the cwd."""
+    work_dir = tmp_path_factory.mktemp('allgigs')
+    for json_file in REPO_ROOT.glob('*.json'):
+        shutil.copy(json_file, work_dir)
+    cwd = os.getcwd()
+    os.environ.setdefault('SUPABASE_SERVICE_ROLE_KEY', 'test-key')
+    os.chdir(work_dir)
+    try:
+        spec = importlib.util.spec_from_file_location('allgigs_v7', REPO_ROOT / 'allgigs V7.py')
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        yield module
+    finally:
+        os.chdir(cwd)
+
+
+def test_generate_unique_ids_matches_scalar_with_missing_values(allgigs):
+    df = pd.DataFrame({
+        'Title': ['Data Engineer', np.nan, 'Tester'],
+        'URL': ['https://example.com/1', 'https://example.com/2', None],
+        'Company': ['Acme', 'Acme', 'Globex'],
+    })
+
+    expected = [allgigs.generate_unique_id(row.Title, row.URL, row.Company) for row in df.itertuples()]
+
+    assert allgigs.generate_unique_ids(df) == expected